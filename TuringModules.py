@@ -6,13 +6,21 @@ base_dir = Path(__file__).resolve().parent
 turing_path = base_dir / "python_machine"
 sys.path.insert(0, str(turing_path))
 
-# Import Turing Machine components
-from python_machine.TuringMachine import TuringMachine, MachineLogic, TuringConfig
-from python_machine.TuringGUI import TuringGUI
+# Import Turing Machine components (headless only: no tkinter, psutil or click)
+from TuringMachine import TuringMachine, MachineLogic, TuringConfig
 
 # Re-export if used as a module
 __all__ = ["TuringMachine", "MachineLogic", "TuringConfig", "TuringGUI"]
 
+
+def __getattr__(name):
+    # The GUI pulls in tkinter and ctypes, so it is only imported when asked for
+    if name == "TuringGUI":
+        from TuringGUI import TuringGUI
+        return TuringGUI
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 if __name__ == "__main__":
     init_rules = """
         INIT | FIND | R
@@ -29,5 +37,6 @@ if __name__ == "__main__":
     print("\n".join(basic_results + [""] + basic_resources))
 
     # Run GUI simulator
+    from TuringGUI import TuringGUI
     _, gui_results, gui_resources = TuringGUI(init_rules).run_simulator(init_tape)
     print("\n".join(gui_results + [""] + gui_resources))
@@ -0,0 +1,129 @@
+"""
+Static analysis of a rule set before it runs.
+
+``analyze_rules`` computes, without running the machine, which states and
+which ``(state, symbol)`` pairs a run can reach, given the symbols the input
+tape may hold. It iterates to a fixpoint: from the reachable states, every
+rule reading a symbol of the tape alphabet makes its target state reachable
+and adds the symbol it writes to the alphabet.
+
+Only the alphabet is tracked, not the tape contents, so the result is a safe
+over-approximation. Every pair a real run reaches is in ``reachable_pairs``,
+and ``missing`` (reachable pairs without a rule) lists every
+MissingTransitionError a run could hit, though not all of them have to
+happen. Rules outside ``reachable_pairs`` can never fire and are listed in
+``dead_rules``. ``pruned`` is the table without them, so the compiled engines
+intern fewer states and symbols and their tables shrink to the alphabet used.
+The one exception is a reachable state whose rules are all dead: it keeps
+them, so its run-time errors read the same, and they are also listed in
+``retained_rules``.
+"""
+
+from TuringMachine import TuringConfig
+
+TransitionsDict = dict[str, dict[str, tuple[str, str, str]]]
+
+
+class MachineAnalysis:
+    """Reachability of one rule set for one input alphabet."""
+
+    __slots__ = (
+        "reachable_states", "reachable_pairs", "missing", "dead_rules", "retained_rules", "alphabet", "pruned",
+    )
+
+    def __init__(
+        self,
+        reachable_states: set[str],
+        reachable_pairs: set[tuple[str, str]],
+        missing: list[tuple[str, str]],
+        dead_rules: list[tuple[str, str, str, str, str]],
+        retained_rules: list[tuple[str, str, str, str, str]],
+        alphabet: list[str],
+        pruned: TransitionsDict,
+    ) -> None:
+        self.reachable_states = reachable_states
+        self.reachable_pairs = reachable_pairs
+        # Reachable (state, symbol) pairs without a rule, halt state excluded
+        self.missing = missing
+        self.dead_rules = dead_rules
+        # Dead rules still in pruned: all the rules of a reachable state
+        self.retained_rules = retained_rules
+        # Every symbol that can be on the tape, blank first
+        self.alphabet = alphabet
+        self.pruned = pruned
+
+    def report(self) -> list[str]:
+        lines = [
+            f"   Alphabet: {' '.join(self.alphabet)} ({len(self.alphabet)} symbols)",
+            f"     States: {len(self.reachable_states)} reachable",
+            f" Dead rules: {len(self.dead_rules)} ({len(self.dead_rules) - len(self.retained_rules)} pruned, "
+            f"{len(self.retained_rules)} kept for states with no live rule)",
+        ]
+        lines.extend(f"             kept: {' '.join(rule)}" for rule in self.retained_rules)
+        lines.append(f"    Missing: {len(self.missing)} reachable (state, symbol) pairs without a rule")
+        lines.extend(f"             {state} {symbol}" for state, symbol in self.missing)
+        return lines
+
+
+def analyze_rules(
+    transitions_dict: TransitionsDict,
+    init_state: str = "INIT",
+    halt_state: str = "HALT",
+    blank_symbol: str = TuringConfig.BLANK,
+    input_alphabet=None,
+) -> MachineAnalysis:
+    """
+    Reachable states and pairs, predicted missing transitions, dead rules and the pruned table.
+
+    ``input_alphabet`` holds the symbols the input tape may contain (an input
+    tape string works). By default any symbol some rule reads is assumed
+    possible on input.
+    """
+    if input_alphabet is None:
+        input_alphabet = {symbol for state_transitions in transitions_dict.values() for symbol in state_transitions}
+    alphabet = {blank_symbol, *input_alphabet}
+    reachable_states = {init_state}
+
+    changed = True
+    while changed:
+        changed = False
+        for state in list(reachable_states):
+            if state == halt_state:
+                continue
+            for symbol, (new_state, new_symbol, _) in transitions_dict.get(state, {}).items():
+                if symbol not in alphabet:
+                    continue
+                if new_state not in reachable_states:
+                    reachable_states.add(new_state)
+                    changed = True
+                if new_symbol not in alphabet:
+                    alphabet.add(new_symbol)
+                    changed = True
+
+    reachable_pairs = {
+        (state, symbol) for state in reachable_states if state != halt_state for symbol in alphabet
+    }
+    missing = sorted(
+        (state, symbol) for state, symbol in reachable_pairs
+        if symbol not in transitions_dict.get(state, {})
+    )
+
+    pruned: TransitionsDict = {}
+    dead_rules = []
+    retained_rules = []
+    for state, state_transitions in transitions_dict.items():
+        kept = {}
+        for symbol, transition in state_transitions.items():
+            if (state, symbol) in reachable_pairs:
+                kept[symbol] = transition
+            else:
+                dead_rules.append((state, symbol, *transition))
+        if not kept and state in reachable_states and state != halt_state:
+            # Keeps "No transition for symbol ..." errors from turning into "No transitions for state ..."
+            kept = state_transitions
+            retained_rules.extend((state, symbol, *transition) for symbol, transition in kept.items())
+        if kept:
+            pruned[state] = kept
+
+    ordered_alphabet = [blank_symbol] + sorted(alphabet - {blank_symbol})
+    return MachineAnalysis(reachable_states, reachable_pairs, missing, dead_rules, retained_rules, ordered_alphabet, pruned)
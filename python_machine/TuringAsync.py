@@ -0,0 +1,74 @@
+"""
+Asyncio execution of headless MachineLogic runs.
+
+``AsyncRun`` advances a machine ``chunk_size`` steps at a time through
+``MachineLogic._run_headless`` and yields to the event loop between chunks,
+so long runs do not block other tasks and many machines can make progress
+concurrently. A chunk always completes before the run notices a timeout or
+cancellation, so the machine is left at a consistent step and
+``AsyncRun.run`` can simply be awaited again to resume (with the same or a
+larger ``MAX_STEPS``).
+
+With an ``executor`` each chunk runs there instead of on the loop thread.
+Use a thread pool: the chunk mutates the machine in place, which a process
+pool cannot do. A cancelled run waits for its in-flight chunk to finish
+before re-raising, for the same consistency guarantee.
+"""
+
+import asyncio
+from concurrent.futures import Executor
+
+from TuringMachine import MachineLogic
+
+
+class AsyncRun:
+    """One resumable, chunked run of a MachineLogic on an input tape."""
+
+    def __init__(
+        self,
+        cpu: MachineLogic,
+        input_tape: str,
+        *,
+        chunk_size: int = 10_000,
+        executor: Executor | None = None,
+    ) -> None:
+        if chunk_size < 1:
+            raise ValueError(f"Invalid chunk_size: {chunk_size}. Must be at least 1")
+        self.cpu = cpu
+        self.input_tape = input_tape
+        self.chunk_size = chunk_size
+        self.executor = executor
+        self.step_count = 0
+
+        cpu.input_tape = input_tape
+        cpu._set_tape(input_tape)
+
+    @property
+    def halted(self) -> bool:
+        return self.cpu.current_state == self.cpu.halt_state
+
+    async def run(self, MAX_STEPS: int = 1_000_000) -> tuple[str, int, int]:
+        """
+        Run until halt or ``MAX_STEPS`` total steps; same ``(tape, steps, rules_no)`` as ``run_logic``.
+
+        Safe to wrap in ``asyncio.wait_for``: on timeout or cancellation the
+        steps done so far are kept in ``step_count`` and a later ``run`` resumes.
+        """
+        cpu = self.cpu
+        loop = asyncio.get_running_loop()
+        while self.step_count < MAX_STEPS and not self.halted:
+            chunk = min(self.chunk_size, MAX_STEPS - self.step_count)
+            if self.executor is None:
+                self.step_count += cpu._run_headless(chunk)
+                await asyncio.sleep(0)
+                continue
+
+            future = loop.run_in_executor(self.executor, cpu._run_headless, chunk)
+            try:
+                self.step_count += await asyncio.shield(future)
+            except asyncio.CancelledError:
+                # The chunk keeps running in the executor; let it land before giving up control
+                self.step_count += await future
+                raise
+
+        return cpu._render_tape(), self.step_count, cpu.rules_no
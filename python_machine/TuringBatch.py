@@ -0,0 +1,78 @@
+"""
+Process-pool batch runner: one compiled rule set, many input tapes.
+
+The ``CompiledMachine`` is shipped to every worker once through the pool
+initializer; each task then only carries an input tape. Results stream
+back as ``(input_tape, result_tape, steps, error)`` in completion order,
+where ``error`` is ``None`` or the failure message for that tape alone.
+"""
+
+import os
+from collections.abc import Iterable, Iterator
+from multiprocessing import get_context
+
+from TuringMachine import TuringConfig
+from TuringCompiler import CompiledMachine
+
+BatchResult = tuple[str, str | None, int, str | None]
+
+_worker_machine: CompiledMachine | None = None
+_worker_max_steps: int = 1_000_000
+
+
+def _init_worker(compiled: CompiledMachine, MAX_STEPS: int) -> None:
+    global _worker_machine, _worker_max_steps
+    _worker_machine = compiled
+    _worker_max_steps = MAX_STEPS
+
+
+def _run_tape(input_tape: str) -> BatchResult:
+    return run_one(_worker_machine, input_tape, _worker_max_steps)
+
+
+def run_one(compiled: CompiledMachine, input_tape: str, MAX_STEPS: int) -> BatchResult:
+    """Run one tape, turning per-tape failures into an error message."""
+    try:
+        final_tape, steps, _ = compiled.run(input_tape, MAX_STEPS=MAX_STEPS)
+    except (
+        TuringConfig.MissingTransitionError,
+        TuringConfig.InvalidSymbolError,
+        TuringConfig.TapeLimitError,
+    ) as e:
+        return input_tape, None, compiled.step_count, f"{type(e).__name__}: {e}"
+
+    if compiled.current_state != compiled.halt_state:
+        return input_tape, final_tape, steps, f"Max steps reached: {MAX_STEPS}"
+    return input_tape, final_tape, steps, None
+
+
+def run_batch(
+    compiled: CompiledMachine,
+    tapes: Iterable[str],
+    workers: int | None = None,
+    *,
+    MAX_STEPS: int = 1_000_000,
+    chunksize: int | None = None,
+) -> Iterator[BatchResult]:
+    """
+    Yield ``(input_tape, result_tape, steps, error)`` for every tape as it completes.
+
+    ``workers`` defaults to the CPU count; ``workers=1`` runs in-process.
+    ``chunksize`` defaults to splitting the batch into ~8 chunks per worker.
+    """
+    tapes = list(tapes)
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(tapes) <= 1:
+        for input_tape in tapes:
+            yield run_one(compiled, input_tape, MAX_STEPS)
+        return
+
+    if chunksize is None:
+        chunksize = max(1, len(tapes) // (workers * 8))
+
+    with get_context().Pool(
+        processes=workers,
+        initializer=_init_worker,
+        initargs=(compiled, MAX_STEPS),
+    ) as pool:
+        yield from pool.imap_unordered(_run_tape, tapes, chunksize=chunksize)
@@ -0,0 +1,333 @@
+"""
+Benchmark suite: canonical machines run on every engine across input sizes.
+
+Each case is one (machine, input size, engine). The engine is built from the
+rule text once (timed as ``parse_s``: parsing, validation and any table
+compilation), then run ``repeat`` times; the best wall time gives
+``steps_per_s``. Peak memory is measured in one extra run under tracemalloc
+so it does not distort the timings. All engines must agree on the result
+tape and step count, and a disagreement is reported as an error.
+
+Cold-start import time of the entry modules is measured first, each in a
+fresh interpreter, together with which heavy dependencies (GUI, psutil,
+click, numpy) the import dragged in.
+
+Results can be saved as a JSON baseline and compared against later:
+
+    python TuringBench.py --save baseline.json
+    python TuringBench.py --compare baseline.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable
+from pathlib import Path
+
+from TuringMachine import MachineLogic, TuringMachine
+import logic_mill_base
+
+REPO_DIR = Path(__file__).resolve().parent.parent
+
+Runner = Callable[[str, int], tuple[str, int]]
+
+IMPORT_MODULES = ("TuringMachine", "TuringCompiler", "TuringCodegen", "logic_mill_base", "TuringModules")
+HEAVY_MODULES = ("tkinter", "ctypes", "psutil", "click", "numpy")
+
+_IMPORT_PROBE = """
+import sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+print(elapsed, ",".join(name for name in {heavy!r} if name in sys.modules))
+"""
+
+
+def _read_rules(path: Path) -> str:
+    return json.loads(path.read_text())["rulesText"] if path.suffix == ".json" else path.read_text()
+
+
+BINARY_COUNTER = """
+// Count the binary number on the tape up to all ones, halt on overflow
+INIT 0 INIT 0 R
+INIT 1 INIT 1 R
+INIT _ INC  _ L
+INC  1 INC  0 L
+INC  0 RET  1 R
+INC  _ HALT _ R
+RET  0 RET  0 R
+RET  1 RET  1 R
+RET  _ INC  _ L
+"""
+
+# Busy beaver champions, blank tape as 0: 107 steps / 13 ones and 47,176,870 steps / 4098 ones
+BUSY_BEAVER_4 = """
+INIT _ B    1 R
+INIT 1 B    1 L
+B    _ INIT 1 L
+B    1 C    _ L
+C    _ HALT 1 R
+C    1 D    1 L
+D    _ D    1 R
+D    1 INIT _ R
+"""
+
+BUSY_BEAVER_5 = """
+INIT _ B    1 R
+INIT 1 C    1 L
+B    _ C    1 R
+B    1 B    1 R
+C    _ D    1 R
+C    1 E    _ L
+D    _ INIT 1 L
+D    1 D    1 L
+E    _ HALT 1 R
+E    1 INIT _ L
+"""
+
+# name: (rules, input tape for a size, sizes, heavy)
+CORPUS: dict[str, tuple[Callable[[], str], Callable[[int], str], tuple[int, ...], bool]] = {
+    "unary_increment": (
+        lambda: _read_rules(REPO_DIR / "example_files" / "unary_increment.json"),
+        lambda n: "|" * n, (1_000, 10_000, 100_000), False,
+    ),
+    "unary_decrement": (
+        lambda: _read_rules(REPO_DIR / "example_files" / "unary_decrement.json"),
+        lambda n: "1" * n, (1_000, 10_000, 100_000), False,
+    ),
+    "multiply": (
+        lambda: _read_rules(REPO_DIR / "test_sol.txt"),
+        lambda n: "|" * n + "*" + "|" * n, (10, 20, 40), False,
+    ),
+    "binary_counter": (
+        lambda: BINARY_COUNTER,
+        lambda n: "0" * n, (8, 12, 16), False,
+    ),
+    "busy_beaver_4": (lambda: BUSY_BEAVER_4, lambda n: "", (0,), False),
+    "busy_beaver_5": (lambda: BUSY_BEAVER_5, lambda n: "", (0,), True),
+}
+
+
+def _prepare_logicmill(rules: str) -> Runner:
+    mill = logic_mill_base.LogicMill(logic_mill_base.parse_transition_rules(rules))
+    return lambda tape, max_steps: mill.run(tape, max_steps)
+
+
+def _prepare_dict(rules: str) -> Runner:
+    cpu = TuringMachine(rules)._make_cpu()
+    return lambda tape, max_steps: cpu.run_logic(tape, MAX_STEPS=max_steps)[:2]
+
+
+def _prepare_compiled(rules: str) -> Runner:
+    from TuringCompiler import CompiledMachine
+
+    cpu = TuringMachine(rules)._make_cpu()
+    compiled = CompiledMachine(cpu.transitions_dict, cpu.init_state, cpu.halt_state, cpu.blank_symbol)
+    return lambda tape, max_steps: compiled.run(tape, MAX_STEPS=max_steps)[:2]
+
+
+def _prepare_codegen(rules: str) -> Runner:
+    from TuringCodegen import CodegenMachine
+
+    cpu = TuringMachine(rules)._make_cpu()
+    codegen = CodegenMachine(cpu.transitions_dict, cpu.init_state, cpu.halt_state, cpu.blank_symbol)
+    return lambda tape, max_steps: codegen.run(tape, MAX_STEPS=max_steps)[:2]
+
+
+def _prepare_macro(rules: str) -> Runner:
+    from TuringMacro import MacroMachine
+
+    cpu = TuringMachine(rules)._make_cpu()
+    macro = MacroMachine(cpu.transitions_dict, cpu.init_state, cpu.halt_state, cpu.blank_symbol)
+
+    def run(tape: str, max_steps: int) -> tuple[str, int]:
+        # Start every run cold so repeats do not measure a pre-warmed cache
+        macro.cache.clear()
+        return macro.run(tape, MAX_STEPS=max_steps)[:2]
+    return run
+
+
+ENGINES: dict[str, Callable[[str], Runner]] = {
+    "logicmill": _prepare_logicmill,
+    "dict": _prepare_dict,
+    "compiled": _prepare_compiled,
+    "macro": _prepare_macro,
+    "codegen": _prepare_codegen,
+}
+
+
+def bench_case(engine: str, rules: str, tape: str, *, repeat: int = 3, max_steps: int = 10**9, memory: bool = True) -> dict:
+    """Time one engine on one input; returns the result row (without machine/size)."""
+    start = time.perf_counter()
+    runner = ENGINES[engine](rules)
+    parse_s = time.perf_counter() - start
+
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        final_tape, steps = runner(tape, max_steps)
+        best = min(best, time.perf_counter() - start)
+
+    peak_kib = None
+    if memory:
+        tracemalloc.start()
+        try:
+            runner(tape, max_steps)
+            peak_kib = round(tracemalloc.get_traced_memory()[1] / 1024, 1)
+        finally:
+            tracemalloc.stop()
+
+    return {
+        "engine": engine,
+        "steps": steps,
+        "wall_s": best,
+        "steps_per_s": steps / best if best else None,
+        "parse_s": parse_s,
+        "peak_kib": peak_kib,
+        "tape_len": len(final_tape),
+        "result": final_tape,
+    }
+
+
+def measure_imports(modules=IMPORT_MODULES, *, repeat: int = 5, out=sys.stdout) -> list[dict]:
+    """Best-of-``repeat`` import time of each module in a fresh interpreter."""
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join([str(REPO_DIR / "python_machine"), str(REPO_DIR)])
+    env["PYTHONDONTWRITEBYTECODE"] = "1"
+    rows = []
+    print(f"{'module':<16} {'import ms':>10}  heavy deps loaded", file=out)
+    for module in modules:
+        probe = _IMPORT_PROBE.format(module=module, heavy=HEAVY_MODULES)
+        best, loaded = float("inf"), ""
+        for _ in range(repeat):
+            output = subprocess.run(
+                [sys.executable, "-c", probe], env=env, capture_output=True, text=True, check=True,
+            ).stdout.split()
+            best = min(best, float(output[0]))
+            loaded = output[1] if len(output) > 1 else ""
+        rows.append({"module": module, "import_s": best, "heavy": loaded.split(",") if loaded else []})
+        print(f"{module:<16} {best * 1000:>10.2f}  {loaded or '-'}", file=out)
+    print(file=out)
+    return rows
+
+
+def run_suite(
+    engines: list[str],
+    machines: list[str],
+    *,
+    repeat: int = 3,
+    memory: bool = True,
+    heavy: bool = False,
+    out=sys.stdout,
+) -> list[dict]:
+    rows = []
+    print(f"{'machine':<16} {'size':>7} {'engine':<10} {'steps':>11} {'wall s':>9} {'steps/s':>12} "
+          f"{'parse ms':>9} {'peak KiB':>9}", file=out)
+    for machine in machines:
+        rules_source, make_tape, sizes, is_heavy = CORPUS[machine]
+        if is_heavy and not heavy:
+            continue
+        rules = rules_source()
+        for size in sizes:
+            tape = make_tape(size)
+            reference = None
+            for engine in engines:
+                try:
+                    row = bench_case(engine, rules, tape, repeat=repeat, memory=memory)
+                except Exception as e:
+                    row = {"engine": engine, "error": f"{type(e).__name__}: {e}"}
+                else:
+                    outcome = (row.pop("result"), row["steps"])
+                    if reference is None:
+                        reference = outcome
+                    elif outcome != reference:
+                        row["error"] = "Result differs from the first engine"
+                row = {"machine": machine, "size": size, **row}
+                rows.append(row)
+                _print_row(row, out)
+    return rows
+
+
+def _print_row(row: dict, out) -> None:
+    head = f"{row['machine']:<16} {row['size']:>7} {row['engine']:<10}"
+    if "steps" not in row:
+        print(f"{head} {row['error']}", file=out)
+        return
+    peak = f"{row['peak_kib']:>9.1f}" if row["peak_kib"] is not None else f"{'-':>9}"
+    line = (f"{head} {row['steps']:>11} {row['wall_s']:>9.4f} {_rate(row['steps_per_s'])} "
+            f"{row['parse_s'] * 1000:>9.2f} {peak}")
+    if "error" in row:
+        line += f"  {row['error']}"
+    print(line, file=out)
+
+
+def _rate(steps_per_s: float | None) -> str:
+    # None when the best run was below the timer resolution
+    return f"{steps_per_s:>12,.0f}" if steps_per_s is not None else f"{'-':>12}"
+
+
+def compare(rows: list[dict], baseline: dict, threshold: float = 0.10, out=sys.stdout) -> int:
+    """Print steps/s against a baseline; returns the number of cases slower by more than ``threshold``."""
+    previous = {
+        (row["machine"], row["size"], row["engine"]): row
+        for row in baseline["results"] if "steps_per_s" in row
+    }
+    regressions = 0
+    print(f"\n{'machine':<16} {'size':>7} {'engine':<10} {'baseline':>12} {'now':>12} {'ratio':>7}", file=out)
+    for row in rows:
+        old = previous.get((row["machine"], row["size"], row["engine"]))
+        if old is None or "steps_per_s" not in row:
+            continue
+        head = f"{row['machine']:<16} {row['size']:>7} {row['engine']:<10} {_rate(old['steps_per_s'])} {_rate(row['steps_per_s'])}"
+        if not row["steps_per_s"] or not old["steps_per_s"]:
+            # Untimed or zero-step run on either side: no meaningful ratio
+            print(f"{head} {'-':>7}", file=out)
+            continue
+        ratio = row["steps_per_s"] / old["steps_per_s"]
+        flag = ""
+        if ratio < 1 - threshold:
+            regressions += 1
+            flag = "  REGRESSION"
+        print(f"{head} {ratio:>7.2f}{flag}", file=out)
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the Turing machine engines.")
+    parser.add_argument("--engines", nargs="+", choices=list(ENGINES), default=list(ENGINES))
+    parser.add_argument("--machines", nargs="+", choices=list(CORPUS), default=list(CORPUS))
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per case; the best wall time is kept")
+    parser.add_argument("--heavy", action="store_true", help="Include long cases such as busy_beaver_5")
+    parser.add_argument("--no-memory", dest="memory", action="store_false", help="Skip the tracemalloc peak run")
+    parser.add_argument("--no-imports", dest="imports", action="store_false", help="Skip the cold-start import timing")
+    parser.add_argument("--save", type=Path, help="Write the results as a JSON baseline")
+    parser.add_argument("--compare", type=Path, help="Compare steps/s against a JSON baseline")
+    parser.add_argument("--threshold", type=float, default=0.10, help="Slowdown ratio reported as a regression")
+    args = parser.parse_args(argv)
+
+    imports = measure_imports() if args.imports else []
+    rows = run_suite(args.engines, args.machines, repeat=args.repeat, memory=args.memory, heavy=args.heavy)
+
+    if args.save:
+        report = {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "imports": imports,
+            "results": rows,
+        }
+        args.save.write_text(json.dumps(report, indent=2))
+
+    if args.compare:
+        regressions = compare(rows, json.loads(args.compare.read_text()), args.threshold)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
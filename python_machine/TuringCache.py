@@ -0,0 +1,127 @@
+"""
+Content-addressed cache of parsed and validated rule sets.
+
+Entries are keyed by a SHA-256 of the rule text (newlines normalized, outer
+whitespace stripped), the parser configuration (init/halt/blank symbols,
+limits, ...) and the cache format version. Each entry holds the transition
+list and the validated ``transitions_dict``, so a hit skips parsing and
+validation entirely.
+
+``RuleCache`` keeps an in-memory LRU of ``max_entries`` entries and, when
+given a ``cache_dir``, also writes every entry there as a marshal file
+(written to a temporary file first, then renamed into place). Disk entries
+carry a header with the format version and Python version. Unreadable,
+stale or mismatching files are deleted and treated as misses, so bumping
+``CACHE_VERSION`` invalidates everything safely.
+"""
+
+import hashlib
+import marshal
+import os
+import sys
+import tempfile
+from collections import OrderedDict
+from pathlib import Path
+
+TransitionsDict = dict[str, dict[str, tuple[str, str, str]]]
+CacheEntry = tuple[list[tuple[str, str, str, str, str]], TransitionsDict]
+
+CACHE_VERSION = 1
+_MAGIC = b"TMRC"
+_SUFFIX = ".tmrc"
+
+
+class RuleCache:
+    """In-memory LRU of parsed rule sets, optionally backed by a cache directory."""
+
+    def __init__(self, max_entries: int = 256, cache_dir: str | os.PathLike | None = None) -> None:
+        if max_entries < 1:
+            raise ValueError(f"Invalid max_entries: {max_entries}. Must be at least 1")
+        self.max_entries = max_entries
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        if self.cache_dir is not None:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.entries: OrderedDict[str, CacheEntry] = OrderedDict()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(rules_text: str, *config) -> str:
+        """Hash of the normalized rule text plus everything that affects parsing."""
+        normalized = rules_text.replace("\r\n", "\n").strip()
+        digest = hashlib.sha256()
+        digest.update(repr((CACHE_VERSION, sys.version_info[:2], config)).encode())
+        digest.update(b"\0")
+        digest.update(normalized.encode())
+        return digest.hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}{_SUFFIX}"
+
+    def get(self, key: str) -> CacheEntry | None:
+        entry = self.entries.get(key)
+        if entry is not None:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+        if self.cache_dir is not None:
+            entry = self._load(key)
+            if entry is not None:
+                self._remember(key, entry)
+                self.disk_hits += 1
+                return entry
+
+        self.misses += 1
+        return None
+
+    def put(self, key: str, transitions: list, transitions_dict: TransitionsDict) -> None:
+        entry = (transitions, transitions_dict)
+        self._remember(key, entry)
+        if self.cache_dir is not None:
+            self._store(key, entry)
+
+    def _remember(self, key: str, entry: CacheEntry) -> None:
+        self.entries[key] = entry
+        self.entries.move_to_end(key)
+        if len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+
+    def _load(self, key: str) -> CacheEntry | None:
+        path = self._path(key)
+        try:
+            data = path.read_bytes()
+        except OSError:
+            return None
+        try:
+            if not data.startswith(_MAGIC):
+                raise ValueError("bad magic")
+            version, python, stored_key, transitions, transitions_dict = marshal.loads(data[len(_MAGIC):])
+            if (version, tuple(python), stored_key) != (CACHE_VERSION, sys.version_info[:2], key):
+                raise ValueError("stale entry")
+        except (ValueError, EOFError, TypeError):
+            path.unlink(missing_ok=True)
+            return None
+        return transitions, transitions_dict
+
+    def _store(self, key: str, entry: CacheEntry) -> None:
+        payload = _MAGIC + marshal.dumps((CACHE_VERSION, sys.version_info[:2], key, *entry))
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as tmp_file:
+                tmp_file.write(payload)
+            os.replace(tmp_path, self._path(key))
+        except OSError:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+
+    def clear(self, *, disk: bool = True) -> None:
+        """Drop every in-memory entry, and with ``disk`` every cache file."""
+        self.entries.clear()
+        if disk and self.cache_dir is not None:
+            for path in self.cache_dir.glob(f"*{_SUFFIX}"):
+                path.unlink(missing_ok=True)
+
+    def __len__(self) -> int:
+        return len(self.entries)
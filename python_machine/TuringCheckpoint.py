@@ -0,0 +1,234 @@
+"""
+Checkpoint and resume for long headless MachineLogic runs.
+
+``CheckpointRun`` steps a machine through ``MachineLogic._run_headless`` in
+chunks and, every ``every_steps`` steps and/or every ``every_seconds``
+seconds, writes the full machine configuration to a checkpoint file. It also
+writes one when the run halts, gets stuck on a missing transition or stops
+at ``MAX_STEPS``. A run started from
+``Checkpoint.load`` continues exactly where the file left off, so a run that
+died, or that hit its step budget, is resumed with a larger ``MAX_STEPS``
+instead of being recomputed from the start.
+
+Checkpoints are only taken between chunks, where the machine is always at a
+step boundary. If the process is interrupted mid-chunk, the last checkpoint
+on disk is still consistent.
+
+File layout (little-endian), written to a temporary file first and then
+renamed into place::
+
+    b"TMCK" | version u8 | rules digest 32s | steps u64 | head, low, high i64 |
+    blank, state, input tape lengths u32 | blank | state | input tape |
+    zlib(tape cells low..high, UTF-8)
+
+The rules digest is a SHA-256 of the sorted transitions; resuming with a
+different rule set raises ``ValueError``.
+"""
+
+import hashlib
+import os
+import struct
+import tempfile
+import time
+import zlib
+from pathlib import Path
+
+from TuringMachine import MachineLogic, TuringConfig
+
+CHECKPOINT_VERSION = 1
+_MAGIC = b"TMCK"
+_HEADER = struct.Struct("<4sB32sQqqqIII")
+
+# Steps per chunk when checkpointing by time only
+_TIME_CHUNK = 100_000
+
+
+def rules_digest(transitions_list: list[tuple[str, str, str, str, str]]) -> bytes:
+    """SHA-256 of the rule set, independent of rule order."""
+    text = "\n".join(" ".join(rule) for rule in sorted(transitions_list))
+    return hashlib.sha256(text.encode()).digest()
+
+
+class Checkpoint:
+    """Snapshot of a machine configuration at a step boundary."""
+
+    __slots__ = ("rules_digest", "step_count", "input_tape", "blank_symbol", "state", "head", "low", "high", "cells")
+
+    def __init__(
+        self,
+        rules_digest: bytes,
+        step_count: int,
+        input_tape: str,
+        blank_symbol: str,
+        state: str,
+        head: int,
+        low: int,
+        high: int,
+        cells: str,
+    ) -> None:
+        self.rules_digest = rules_digest
+        self.step_count = step_count
+        self.input_tape = input_tape
+        self.blank_symbol = blank_symbol
+        self.state = state
+        self.head = head
+        self.low = low
+        self.high = high
+        # Tape cells low..high, blanks included
+        self.cells = cells
+
+    @classmethod
+    def capture(cls, cpu: MachineLogic, step_count: int) -> "Checkpoint":
+        tape, blank = cpu.tape, cpu.blank_symbol
+        cells = "".join([tape.get(i, blank) for i in range(cpu.tape_low, cpu.tape_high + 1)])
+        return cls(
+            rules_digest(cpu.transitions_list), step_count, cpu.input_tape, blank,
+            cpu.current_state, cpu.head_position, cpu.tape_low, cpu.tape_high, cells,
+        )
+
+    def apply(self, cpu: MachineLogic) -> None:
+        """Put ``cpu`` in this configuration; its rules must be the ones checkpointed."""
+        if rules_digest(cpu.transitions_list) != self.rules_digest:
+            raise ValueError("Checkpoint was taken with a different rule set")
+        if cpu.blank_symbol != self.blank_symbol:
+            raise ValueError(f"Checkpoint blank symbol {self.blank_symbol!r} does not match {cpu.blank_symbol!r}")
+        blank = self.blank_symbol
+        cpu.input_tape = self.input_tape
+        cpu.current_state = self.state
+        cpu.head_position = self.head
+        cpu.tape_low, cpu.tape_high = self.low, self.high
+        cpu.tape = {
+            self.low + i: symbol for i, symbol in enumerate(self.cells) if symbol != blank
+        }
+        cpu.running = self.state != cpu.halt_state
+
+    def to_bytes(self) -> bytes:
+        blank, state, input_tape = (text.encode() for text in (self.blank_symbol, self.state, self.input_tape))
+        header = _HEADER.pack(
+            _MAGIC, CHECKPOINT_VERSION, self.rules_digest, self.step_count,
+            self.head, self.low, self.high, len(blank), len(state), len(input_tape),
+        )
+        return b"".join((header, blank, state, input_tape, zlib.compress(self.cells.encode())))
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "Checkpoint":
+        try:
+            (magic, version, digest, step_count, head, low, high,
+             blank_len, state_len, input_len) = _HEADER.unpack_from(data)
+        except struct.error:
+            raise ValueError("Truncated checkpoint") from None
+        if magic != _MAGIC:
+            raise ValueError("Not a checkpoint file")
+        if version != CHECKPOINT_VERSION:
+            raise ValueError(f"Unsupported checkpoint version {version}. Expected {CHECKPOINT_VERSION}")
+
+        pos = _HEADER.size
+        fields = []
+        for length in (blank_len, state_len, input_len):
+            fields.append(data[pos:pos + length].decode())
+            pos += length
+        try:
+            cells = zlib.decompress(data[pos:]).decode()
+        except zlib.error:
+            raise ValueError("Corrupt checkpoint tape") from None
+        if len(cells) != high - low + 1:
+            raise ValueError("Corrupt checkpoint tape")
+        blank, state, input_tape = fields
+        return cls(digest, step_count, input_tape, blank, state, head, low, high, cells)
+
+    def save(self, path: str | os.PathLike) -> None:
+        """Write atomically: a crash leaves either the old or the new checkpoint, never a partial one."""
+        path = Path(path)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as tmp_file:
+                tmp_file.write(self.to_bytes())
+            os.replace(tmp_path, path)
+        except OSError:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+
+    @classmethod
+    def load(cls, path: str | os.PathLike) -> "Checkpoint":
+        return cls.from_bytes(Path(path).read_bytes())
+
+
+class CheckpointRun:
+    """A headless run that checkpoints itself to ``path`` as it goes."""
+
+    def __init__(
+        self,
+        cpu: MachineLogic,
+        path: str | os.PathLike,
+        *,
+        every_steps: int | None = None,
+        every_seconds: float | None = None,
+    ) -> None:
+        if every_steps is None and every_seconds is None:
+            raise ValueError("Give every_steps, every_seconds or both")
+        if every_steps is not None and every_steps < 1:
+            raise ValueError(f"Invalid every_steps: {every_steps}. Must be at least 1")
+        if every_seconds is not None and every_seconds <= 0:
+            raise ValueError(f"Invalid every_seconds: {every_seconds}. Must be positive")
+        self.cpu = cpu
+        self.path = Path(path)
+        self.every_steps = every_steps
+        self.every_seconds = every_seconds
+        self.step_count = 0
+        self.checkpoints_written = 0
+
+    def start(self, input_tape: str) -> None:
+        self.cpu.input_tape = input_tape
+        self.cpu._set_tape(input_tape)
+        self.step_count = 0
+
+    def resume(self, checkpoint: Checkpoint) -> None:
+        checkpoint.apply(self.cpu)
+        self.step_count = checkpoint.step_count
+
+    def checkpoint(self) -> None:
+        Checkpoint.capture(self.cpu, self.step_count).save(self.path)
+        self.checkpoints_written += 1
+
+    def run(self, MAX_STEPS: int = 1_000_000) -> tuple[str, int, int]:
+        """
+        Run until halt or ``MAX_STEPS`` total steps; same ``(tape, steps, rules_no)`` as ``run_logic``.
+
+        ``MAX_STEPS`` counts from the original start, so after a resume it is
+        the new overall budget, not the number of steps still to run.
+        """
+        cpu = self.cpu
+        every_steps, every_seconds = self.every_steps, self.every_seconds
+        chunk_size = every_steps or _TIME_CHUNK
+        if every_seconds is not None:
+            chunk_size = min(chunk_size, _TIME_CHUNK)
+        next_mark = self.step_count + every_steps if every_steps is not None else None
+        saved_at = self.step_count if self.checkpoints_written else None
+        last_saved = time.monotonic()
+
+        while self.step_count < MAX_STEPS and cpu.current_state != cpu.halt_state:
+            chunk = min(chunk_size, MAX_STEPS - self.step_count)
+            if next_mark is not None:
+                chunk = min(chunk, next_mark - self.step_count)
+            try:
+                self.step_count += cpu._run_headless(chunk)
+            except TuringConfig.MissingTransitionError:
+                # The machine is stuck at a step boundary; keep where it got to
+                self.step_count += cpu.steps_run
+                self.checkpoint()
+                raise
+
+            now = time.monotonic()
+            due_by_steps = next_mark is not None and self.step_count >= next_mark
+            if due_by_steps or (every_seconds is not None and now - last_saved >= every_seconds):
+                self.checkpoint()
+                saved_at, last_saved = self.step_count, now
+                if due_by_steps:
+                    next_mark += every_steps
+
+        if cpu.current_state == cpu.halt_state:
+            cpu.running = False
+        # Always leave the final configuration on disk, so the budget can be raised later
+        if saved_at != self.step_count:
+            self.checkpoint()
+        return cpu._render_tape(), self.step_count, cpu.rules_no
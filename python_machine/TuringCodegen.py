@@ -0,0 +1,184 @@
+"""
+Code-generating Turing Machine engine.
+
+``CodegenMachine`` turns the interned transition table of a ``CompiledMachine``
+into the Python source of one run function for that rule set: the state is a
+small int in a local variable, states are dispatched through a binary tree of
+``if state < k`` tests, each state branches on the symbol under the head, and
+the tape buffer, head index and step counter all stay in locals. The loop
+does no attribute lookups, dict lookups or table indexing; the only calls
+left are on tape growth.
+
+The source is kept in ``CodegenMachine.source`` for inspection, compiled once
+per distinct source and cached, and registered with ``linecache`` so
+tracebacks and debuggers show the generated lines. The cache keeps the
+``_CACHE_SIZE`` most recently used functions and drops the linecache entry
+of each one it evicts.
+"""
+
+import hashlib
+import linecache
+from collections import OrderedDict
+
+from TuringMachine import TuringConfig
+from TuringCompiler import CompiledMachine
+
+# States per leaf of the dispatch tree; larger machines bisect on the state id
+_LEAF_STATES = 4
+
+
+# Compiled run functions kept, least recently used first
+_CACHE_SIZE = 256
+_compiled: OrderedDict[str, tuple[str, object]] = OrderedDict()
+
+
+def _compile_source(source: str):
+    """Compile ``source`` once; its linecache entry lives exactly as long as its cache entry."""
+    cached = _compiled.get(source)
+    if cached is not None:
+        _compiled.move_to_end(source)
+        return cached[1]
+
+    filename = f"<turing-codegen {hashlib.sha1(source.encode()).hexdigest()[:12]}>"
+    lines = source.splitlines(keepends=True)
+    linecache.cache[filename] = (len(source), None, lines, filename)
+    namespace: dict = {"TapeLimitError": TuringConfig.TapeLimitError}
+    exec(compile(source, filename, "exec"), namespace)
+    _compiled[source] = filename, namespace["run"]
+    if len(_compiled) > _CACHE_SIZE:
+        evicted_filename, _ = _compiled.popitem(last=False)[1]
+        linecache.cache.pop(evicted_filename, None)
+    return namespace["run"]
+
+
+class CodegenMachine(CompiledMachine):
+    """CompiledMachine whose run loop is generated Python source for this rule set."""
+
+    def __init__(
+        self,
+        transitions_dict: dict[str, dict[str, tuple[str, str, str]]],
+        init_state: str = "INIT",
+        halt_state: str = "HALT",
+        blank_symbol: str = TuringConfig.BLANK,
+    ) -> None:
+        super().__init__(transitions_dict, init_state, halt_state, blank_symbol)
+        self.source = self._generate_source()
+        self.function = _compile_source(self.source)
+
+    def _generate_source(self) -> str:
+        """
+        Python source of ``run(buf, pos, low, high, tape, MAX_STEPS) -> (state, pos, steps, low, high, error)``.
+
+        ``low``/``high`` are the head range as buffer indices, as in ``_run_dense``;
+        a move only checks the buffer edge once it passes them. ``error`` is the TapeLimitError that stopped the run, or None. It is
+        returned rather than raised so the caller still gets the state, head
+        and step count it stopped at, as ``_run_dense`` leaves them.
+        """
+        lines = [
+            f"# Generated by TuringCodegen: {len(self.states)} states, {len(self.symbols)} symbols, {self.rules_no} rules",
+            f"# States:  {', '.join(f'{i}={state}' for i, state in enumerate(self.states))}",
+            f"# Symbols: {', '.join(f'{i}={symbol!r}' for i, symbol in enumerate(self.symbols))}",
+            "def run(buf, pos, low, high, tape, MAX_STEPS):",
+            f"    state = {self.state_ids[self.init_state]}",
+            "    size = len(buf)",
+            "    steps = 0",
+            "    try:",
+            "        while steps < MAX_STEPS:",
+            "            sym = buf[pos]",
+        ]
+        self._emit_dispatch(lines, 0, len(self.states), "            ")
+        lines += [
+            "            steps += 1",
+            "    except TapeLimitError as error:",
+            "        # Only the growth of the step that moved off the tape failed",
+            "        return state, pos, steps + 1, low, high, error",
+            "    return state, pos, steps, low, high, None",
+            "",
+        ]
+        return "\n".join(lines)
+
+    def _emit_dispatch(self, lines: list[str], low: int, high: int, indent: str) -> None:
+        """Branch on state ids ``low <= state < high``."""
+        if high - low > _LEAF_STATES:
+            middle = (low + high) // 2
+            lines.append(f"{indent}if state < {middle}:")
+            self._emit_dispatch(lines, low, middle, indent + "    ")
+            lines.append(f"{indent}else:")
+            self._emit_dispatch(lines, middle, high, indent + "    ")
+            return
+
+        for state_id in range(low, high):
+            if high - low == 1:
+                body_indent = indent
+            else:
+                keyword = "if" if state_id == low else "elif" if state_id < high - 1 else "else"
+                test = "" if keyword == "else" else f" state == {state_id}"
+                lines.append(f"{indent}{keyword}{test}:  # {self.states[state_id]}")
+                body_indent = indent + "    "
+            self._emit_state(lines, state_id, body_indent)
+
+    def _emit_state(self, lines: list[str], state_id: int, indent: str) -> None:
+        """Branch on the symbol under the head for one state; halt and dead ends break."""
+        width = self.width
+        row = state_id * width
+        entries = [
+            (symbol_id, self.table[row + symbol_id])
+            for symbol_id in range(width) if self.table[row + symbol_id] is not None
+        ]
+        if not entries:
+            lines.append(f"{indent}break")
+            return
+
+        for i, (symbol_id, (next_row, write_id, delta)) in enumerate(entries):
+            keyword = "if" if i == 0 else "elif"
+            lines.append(f"{indent}{keyword} sym == {symbol_id}:")
+            body = indent + "    "
+            if write_id != symbol_id:
+                lines.append(f"{body}buf[pos] = {write_id}")
+            if next_row != row:
+                lines.append(f"{body}state = {next_row // width}")
+            if delta > 0:
+                lines.append(f"{body}pos += 1")
+                lines.append(f"{body}if pos > high:")
+                lines.append(f"{body}    high = pos")
+                lines.append(f"{body}    if pos == size:")
+                lines.append(f"{body}        pos = high = tape.grow(pos)")
+            else:
+                lines.append(f"{body}pos -= 1")
+                lines.append(f"{body}if pos < low:")
+                lines.append(f"{body}    low = pos")
+                lines.append(f"{body}    if pos < 0:")
+                lines.append(f"{body}        grown = tape.grow(pos)")
+                lines.append(f"{body}        high += grown - pos")
+                lines.append(f"{body}        pos = low = grown")
+            lines.append(f"{body}        buf = tape.buf")
+            lines.append(f"{body}        size = len(buf)")
+        lines.append(f"{indent}else:")
+        lines.append(f"{indent}    break")
+
+    def run(
+        self,
+        input_tape: str,
+        *,
+        MAX_STEPS: int = 1_000_000,
+    ) -> tuple[str, int, int]:
+        """Run headless; same ``(tape, steps, rules_no)`` contract as ``MachineLogic.run_logic``."""
+        self.input_tape = input_tape
+        self.step_count = 0
+        tape = self.tape = self.make_tape(input_tape, "dense")
+
+        origin = tape.origin
+        state_id, pos, step_count, low, high, error = self.function(
+            tape.buf, origin, tape.low + origin, tape.high + origin, tape, MAX_STEPS
+        )
+
+        self.current_state = self.states[state_id]
+        self.head_position = pos - tape.origin
+        self.step_count = step_count
+        tape.low, tape.high = low - tape.origin, high - tape.origin
+        if error is not None:
+            raise error
+        if step_count < MAX_STEPS and self.current_state != self.halt_state:
+            raise self._missing_transition(state_id * self.width, tape.buf[pos], input_tape)
+
+        return tape.render(self.symbols), step_count, self.rules_no
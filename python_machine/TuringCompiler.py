@@ -0,0 +1,322 @@
+"""
+Integer-compiled Turing Machine engine.
+
+States and symbols from a validated ``MachineLogic.transitions_dict`` are
+interned to small integers and laid out in a flat lookup table indexed by
+``state * width + symbol``, which a tight run loop steps through without any
+string comparisons or nested dict lookups. The tape is either a
+``DenseTape`` (bytearray) or a ``SparseTape`` (dict), see ``TuringTape``.
+"""
+
+from TuringMachine import TuringConfig
+from TuringTape import DenseTape, SparseTape
+
+TableEntry = tuple[int, int, int]
+
+
+class CompiledMachine:
+    """Flat integer transition table plus its run loop."""
+
+    def __init__(
+        self,
+        transitions_dict: dict[str, dict[str, tuple[str, str, str]]],
+        init_state: str = "INIT",
+        halt_state: str = "HALT",
+        blank_symbol: str = TuringConfig.BLANK,
+    ) -> None:
+
+        self.init_state = init_state
+        self.halt_state = halt_state
+        self.blank_symbol = blank_symbol
+        self.transitions_dict = transitions_dict
+
+        # The blank symbol is always id 0 so an empty cell reads as blank
+        self.symbols: list[str] = [blank_symbol]
+        self.symbol_ids: dict[str, int] = {blank_symbol: 0}
+        self.states: list[str] = []
+        self.state_ids: dict[str, int] = {}
+
+        self._intern_state(init_state)
+        self._intern_state(halt_state)
+        for current_state, state_transitions in transitions_dict.items():
+            self._intern_state(current_state)
+            for current_symbol, (new_state, new_symbol, _) in state_transitions.items():
+                self._intern_state(new_state)
+                self._intern_symbol(current_symbol)
+                self._intern_symbol(new_symbol)
+
+        self._build_table()
+        self.rules_no = sum(len(state_transitions) for state_transitions in transitions_dict.values())
+
+        self.head_position: int = 0
+        self.current_state: str = init_state
+        self.step_count: int = 0
+
+    def _intern_state(self, state: str) -> int:
+        if state not in self.state_ids:
+            self.state_ids[state] = len(self.states)
+            self.states.append(state)
+        return self.state_ids[state]
+
+    def _intern_symbol(self, symbol: str) -> int:
+        if symbol not in self.symbol_ids:
+            self.symbol_ids[symbol] = len(self.symbols)
+            self.symbols.append(symbol)
+        return self.symbol_ids[symbol]
+
+    def _build_table(self) -> None:
+        """
+        Lay out the transitions as ``table[state * width + symbol]``.
+
+        Each entry is ``(next_state * width, write_symbol, delta)`` with the
+        next state pre-multiplied so the loop can index the next row directly.
+        Missing transitions and every cell of the halt row are ``None``.
+        """
+        width = self.width = len(self.symbols)
+        table: list[TableEntry | None] = [None] * (len(self.states) * width)
+        shifts = {TuringConfig.LEFT: -1, TuringConfig.RIGHT: +1}
+
+        for current_state, state_transitions in self.transitions_dict.items():
+            if current_state == self.halt_state:
+                continue
+            row = self.state_ids[current_state] * width
+            for current_symbol, (new_state, new_symbol, move_direction) in state_transitions.items():
+                table[row + self.symbol_ids[current_symbol]] = (
+                    self.state_ids[new_state] * width,
+                    self.symbol_ids[new_symbol],
+                    shifts[move_direction],
+                )
+        self.table = table
+        self._find_sweeps()
+
+    def _find_sweeps(self) -> None:
+        """
+        Detect self-loop sweeps such as ``FIND | FIND | R``.
+
+        A sweep keeps the state, rewrites the symbol it read and moves in a
+        fixed direction, so a run of such symbols can be jumped in one go.
+        ``sweeps`` maps a table index to ``(run_symbols, delta)``, where
+        ``run_symbols`` holds every symbol id the state sweeps over in that
+        direction. ``sweep_table`` is ``table`` with those cells set to
+        ``None`` so the run loop only pays for the check on its slow path.
+        """
+        width = self.width
+        runs: dict[tuple[int, int], bytearray] = {}
+        for idx, entry in enumerate(self.table):
+            if entry is None:
+                continue
+            next_row, write_id, delta = entry
+            row, symbol_id = divmod(idx, width)
+            if next_row == row * width and write_id == symbol_id and width <= 256:
+                runs.setdefault((next_row, delta), bytearray()).append(symbol_id)
+
+        self.sweeps: dict[int, tuple[bytes, int]] = {}
+        self.sweep_table = self.table.copy()
+        for (row, delta), run_symbols in runs.items():
+            for symbol_id in run_symbols:
+                self.sweeps[row + symbol_id] = (bytes(run_symbols), delta)
+                self.sweep_table[row + symbol_id] = None
+
+    def encode_tape(self, input_tape: str) -> list[int]:
+        """Map the input tape to symbol ids, widening the table for unseen symbols."""
+        if " " in input_tape:
+            raise TuringConfig.InvalidSymbolError("Input tape must not contain spaces")
+
+        unseen = [symbol for symbol in dict.fromkeys(input_tape) if symbol not in self.symbol_ids]
+        if unseen:
+            for symbol in unseen:
+                self._intern_symbol(symbol)
+            self._build_table()
+
+        symbol_ids = self.symbol_ids
+        return [symbol_ids[symbol] for symbol in input_tape]
+
+    def _missing_transition(self, row: int, symbol_id: int, input_tape: str) -> Exception:
+        state = self.states[row // self.width]
+        if not self.transitions_dict.get(state):
+            return TuringConfig.MissingTransitionError(
+                f"No transitions for state {state} with input tape {input_tape}"
+            )
+        return TuringConfig.MissingTransitionError(
+            f"No transition for symbol {self.symbols[symbol_id]} "
+            f"in state {state} with input tape {input_tape}"
+        )
+
+    def make_tape(self, input_tape: str, tape_type: str = "dense") -> DenseTape | SparseTape:
+        """Encode the input tape into a fresh tape of the requested storage type."""
+        if tape_type not in TuringConfig.TAPES:
+            raise ValueError(f"Unknown tape {tape_type!r}. Must be one of {TuringConfig.TAPES}")
+
+        cells = self.encode_tape(input_tape)
+        if tape_type == "sparse":
+            return SparseTape(cells)
+        if self.width > 256:
+            raise ValueError(f"Dense tape holds at most 256 symbols, alphabet has {self.width}")
+        return DenseTape(cells)
+
+    def tape_usage(self) -> tuple[int, int]:
+        """``(cells, bytes)`` of the tape of the last run, see ``DenseTape.usage``/``SparseTape.usage``."""
+        return self.tape.usage()
+
+    def run(
+        self,
+        input_tape: str,
+        *,
+        MAX_STEPS: int = 1_000_000,
+        tape_type: str = "dense",
+        skip_runs: bool = True,
+    ) -> tuple[str, int, int]:
+        """
+        Run headless; same ``(tape, steps, rules_no)`` contract as ``MachineLogic.run_logic``.
+
+        With ``skip_runs`` the dense loop jumps over self-loop sweeps in one
+        scan, still counting one step per cell crossed.
+        """
+        self.input_tape = input_tape
+        self.step_count = 0
+        self.tape = self.make_tape(input_tape, tape_type)
+        row = self.state_ids[self.init_state] * self.width
+
+        if isinstance(self.tape, DenseTape):
+            row, head, step_count, symbol_id = self._run_dense(
+                self.tape, row, 0, MAX_STEPS, skip_runs=skip_runs
+            )
+        else:
+            row, head, step_count, symbol_id = self._run_sparse(self.tape, row, 0, MAX_STEPS)
+
+        self.current_state = self.states[row // self.width]
+        self.head_position = head
+        self.step_count = step_count
+        if symbol_id is not None:
+            raise self._missing_transition(row, symbol_id, input_tape)
+
+        return self.tape.render(self.symbols), step_count, self.rules_no
+
+    def _run_dense(
+        self, tape: DenseTape, row: int, head: int, MAX_STEPS: int, *, skip_runs: bool = True
+    ) -> tuple[int, int, int, int | None]:
+        """
+        Step over a DenseTape until halt, a missing transition or MAX_STEPS.
+
+        Returns ``(row, head, steps, stuck_symbol)`` where ``stuck_symbol`` is the
+        symbol id with no transition, or ``None`` if the run did not get stuck.
+        """
+        halt_row = self.state_ids[self.halt_state] * self.width
+        if skip_runs and self.sweeps:
+            table, sweeps = self.sweep_table, self.sweeps
+        else:
+            table, sweeps = self.table, {}
+        buf = tape.buf
+        size = len(buf)
+        pos = head + tape.origin
+        # Head range as buffer indices; it lies inside the buffer, so one test covers both
+        low, high = tape.low + tape.origin, tape.high + tape.origin
+
+        step_count = 0
+        try:
+            while step_count < MAX_STEPS:
+                idx = row + buf[pos]
+                entry = table[idx]
+                if entry is None:
+                    sweep = sweeps.get(idx)
+                    if sweep is None:
+                        break
+                    run_symbols, delta = sweep
+                    run_length = _sweep_length(buf, pos, run_symbols, delta, MAX_STEPS - step_count)
+                    pos += run_length * delta
+                    step_count += run_length
+                else:
+                    row, buf[pos], delta = entry
+                    pos += delta
+                    step_count += 1
+                if not low <= pos <= high:
+                    if pos < low:
+                        low = pos
+                    else:
+                        high = pos
+                    if not 0 <= pos < size:
+                        grown = tape.grow(pos)
+                        low += grown - pos
+                        high += grown - pos
+                        pos = grown
+                        buf = tape.buf
+                        size = len(buf)
+        finally:
+            # Also reached through TapeLimitError from tape.grow, so callers see where the run stopped
+            self.current_state = self.states[row // self.width]
+            self.head_position = pos - tape.origin
+            self.step_count = step_count
+            tape.low, tape.high = low - tape.origin, high - tape.origin
+
+        stuck = None
+        if step_count < MAX_STEPS and row != halt_row:
+            stuck = buf[pos]
+        return row, pos - tape.origin, step_count, stuck
+
+    def _run_sparse(
+        self, tape: SparseTape, row: int, head: int, MAX_STEPS: int
+    ) -> tuple[int, int, int, int | None]:
+        """Same loop as ``_run_dense`` over a SparseTape."""
+        table = self.table
+        halt_row = self.state_ids[self.halt_state] * self.width
+        cells = tape.cells
+        cells_get = cells.get
+        cells_pop = cells.pop
+        low, high = tape.low, tape.high
+
+        step_count = 0
+        while step_count < MAX_STEPS:
+            entry = table[row + cells_get(head, 0)]
+            if entry is None:
+                break
+            row, write_id, delta = entry
+            if write_id:
+                cells[head] = write_id
+            else:
+                cells_pop(head, None)
+            head += delta
+            step_count += 1
+            if not low <= head <= high:
+                if head < low:
+                    low = head
+                else:
+                    high = head
+        tape.low, tape.high = low, high
+
+        stuck = None
+        if step_count < MAX_STEPS and row != halt_row:
+            stuck = cells_get(head, 0)
+        return row, head, step_count, stuck
+
+
+def _sweep_length(buf: bytearray, pos: int, run_symbols: bytes, delta: int, limit: int) -> int:
+    """
+    Count the cells from ``pos`` in direction ``delta`` holding ``run_symbols``.
+
+    The count stops at the first other symbol, after ``limit`` cells or at the
+    buffer edge. Doubling chunks are stripped so the scan stays in C and costs
+    O(run length).
+    """
+    chunk = 64
+    if delta > 0:
+        end = min(pos + limit, len(buf))
+        start = pos
+        while start < end:
+            stop = min(start + chunk, end)
+            rest = len(buf[start:stop].lstrip(run_symbols))
+            if rest:
+                return stop - rest - pos
+            start = stop
+            chunk *= 2
+        return end - pos
+
+    end = max(pos - limit + 1, 0)
+    stop = pos + 1
+    while stop > end:
+        start = max(stop - chunk, end)
+        rest = len(buf[start:stop].rstrip(run_symbols))
+        if rest:
+            return pos - start - rest + 1
+        stop = start
+        chunk *= 2
+    return pos - end + 1
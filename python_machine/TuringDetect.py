@@ -0,0 +1,161 @@
+"""
+Translated-cycler detection for MachineLogic runs.
+
+A translated cycler repeats the same local behaviour while drifting along the
+tape, so its configuration never repeats and plain cycle detection misses it.
+Each time the head reaches a new tape extreme (a "record") the detector saves
+the state, step and tape up to the head. For two right records at steps
+t1 < t2, positions p1 < p2 and the same state, let L be how far left of p1 the
+head went between them. If the cells [p1 - L, p1] at t1 equal [p2 - L, p2] at
+t2 and everything right of p1 was blank, the run from t2 only sees a shifted
+copy of what it saw from t1, so it repeats forever, p2 - p1 cells further
+right every t2 - t1 steps. Left records are handled the same way, mirrored.
+
+Only the last ``max_records`` records per direction are kept, each with the
+``window_size`` cells behind the head, so memory is bounded; cycles whose
+excursion L reaches past that window are not reported.
+"""
+
+from collections import deque
+
+from TuringMachine import MachineLogic, TuringConfig
+
+
+class _Record:
+    __slots__ = ("state", "step", "position", "excursion", "window")
+
+    def __init__(self, state: str, step: int, position: int, window: str) -> None:
+        self.state = state
+        self.step = step
+        self.position = position
+        # Furthest the head has been back from this record's edge since it was set
+        self.excursion = 0
+        # Cells from the head backwards, at the time of the record
+        self.window = window
+
+
+class TranslatedCyclerDetector:
+    """Runs a MachineLogic headless and raises NonHaltingError on a proven translated cycle."""
+
+    def __init__(self, cpu: MachineLogic, *, max_records: int = 64, window_size: int = 512) -> None:
+        self.cpu = cpu
+        self.max_records = max_records
+        self.window_size = window_size
+
+    def run(
+        self,
+        input_tape: str,
+        *,
+        MAX_STEPS: int = 1_000_000,
+    ) -> tuple[str, int, int]:
+        """Same ``(tape, steps, rules_no)`` contract as ``MachineLogic.run_logic``."""
+        cpu = self.cpu
+        cpu.input_tape = input_tape
+        cpu._set_tape(input_tape)
+
+        transitions = cpu.transitions_dict
+        tape = cpu.tape
+        blank = cpu.blank_symbol
+        halt_state = cpu.halt_state
+        shifts = {TuringConfig.LEFT: -1, TuringConfig.RIGHT: +1}
+
+        # Cells beyond these input positions are blank until the head gets there
+        input_low = min(tape, default=0)
+        input_high = max(tape, default=0)
+
+        right_records: deque[_Record] = deque(maxlen=self.max_records)
+        left_records: deque[_Record] = deque(maxlen=self.max_records)
+        since_right = since_left = 0
+
+        state = cpu.current_state
+        head = cpu.head_position
+        low, high = cpu.tape_low, cpu.tape_high
+
+        step_count = 0
+        try:
+            while step_count < MAX_STEPS:
+                if state == halt_state:
+                    cpu.running = False
+                    break
+
+                state_transitions = transitions.get(state)
+                if not state_transitions:
+                    raise TuringConfig.MissingTransitionError(
+                        f"No transitions for state {state} with input tape {input_tape}"
+                    )
+
+                current_symbol = tape.get(head, blank)
+                transition = state_transitions.get(current_symbol)
+                if not transition:
+                    raise TuringConfig.MissingTransitionError(
+                        f"No transition for symbol {current_symbol or blank} "
+                        f"in state {state} with input tape {input_tape}"
+                    )
+
+                state, new_symbol, move_direction = transition
+                if new_symbol == blank:
+                    tape.pop(head, None)
+                else:
+                    tape[head] = new_symbol
+
+                head += shifts[move_direction]
+                step_count += 1
+
+                if head > high:
+                    high = head
+                    if head >= input_high:
+                        self._on_record(right_records, since_right, state, step_count, head, +1)
+                    since_right = 0
+                elif head < low:
+                    low = head
+                    if head <= input_low:
+                        self._on_record(left_records, since_left, state, step_count, head, -1)
+                    since_left = 0
+
+                if high - head > since_right:
+                    since_right = high - head
+                if head - low > since_left:
+                    since_left = head - low
+        finally:
+            cpu.current_state = state
+            cpu.head_position = head
+            cpu.tape_low, cpu.tape_high = low, high
+
+        return cpu._render_tape(), step_count, cpu.rules_no
+
+    def _on_record(
+        self,
+        records: deque[_Record],
+        excursion: int,
+        state: str,
+        step: int,
+        position: int,
+        direction: int,
+    ) -> None:
+        """
+        Compare a new record against earlier ones in the same state, then store it.
+
+        ``excursion`` is how far back the head went from the previous record
+        edge (one cell behind ``position``) since that record was set.
+        """
+        tape = self.cpu.tape
+        blank = self.cpu.blank_symbol
+        window = "".join([tape.get(position - direction * i, blank) for i in range(self.window_size)])
+        for record in records:
+            # Back past this record's edge = excursion past the previous edge minus how far the edge moved since
+            record.excursion = max(record.excursion, excursion - abs(position - direction - record.position))
+            if record.state != state or record.excursion >= self.window_size:
+                continue
+
+            shift = position - record.position
+            if record.window[:record.excursion + 1] == window[:record.excursion + 1]:
+                period = step - record.step
+                side = "right" if direction > 0 else "left"
+                raise TuringConfig.NonHaltingError(
+                    f"Machine does not halt: translated cycle of {period} steps moving "
+                    f"{abs(shift)} cells {side} every period from step {record.step} "
+                    f"with input tape {self.cpu.input_tape}",
+                    period, record.step, shift,
+                )
+
+        records.append(_Record(state, step, position, window))
@@ -1,7 +1,8 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
 from TuringMachine import MachineLogic, TuringConfig, TuringMachine
-import ctypes, platform
+from TuringHistory import StepHistory
+import ctypes, platform, threading
 
 class TuringGUI:
     def __init__(self, transition_rules_str: str | None = None):
@@ -15,15 +16,29 @@ class TuringGUI:
 
         self.init_rules = transition_rules_str
         self.turing = TuringMachine(transition_rules_str)
-        self.cpu = MachineLogic(self.turing.transition_rules)
+        self.cpu = MachineLogic(self.turing.transition_rules, transitions_dict=self.turing.transitions_dict)
 
         self.MAX_STEPS = 1_000_000
         self.BASE_STEP = 1
         self.DELAY = 300
+        self.KEYFRAME_INTERVAL = 512
+        self.CELL_SIZE = 32
+        self.CELL_PAD = 4
+        self.TAPE_CELLS = 21
+        self.FRAME_RATE = 30
+        self.WORKER_BATCH = 4096
+        self.RUN_MODES = ("Animate every step", "Fast, sampled frames")
+
+        # Fast run mode: the worker thread steps the machine, Tk samples it FRAME_RATE times a second
+        self.worker = None
+        self.worker_outcome = None
+        self.poll_id = None
+        self.stop_event = threading.Event()
+        self.run_lock = threading.RLock()
 
         self.init_time = TuringConfig.get_timestamp()
         self.init_memory = TuringConfig.get_current_memory_mb()
-        self.history = []
+        self.history = StepHistory(self.KEYFRAME_INTERVAL, self.cpu.blank_symbol)
 
     @staticmethod
     def set_dpi_awareness():
@@ -51,18 +66,22 @@ class TuringGUI:
         tape_card = ttk.LabelFrame(self.main, text="Tape", padding=10, style="Bold.TLabelframe")
         tape_card.grid(row=1, column=0, columnspan=2, sticky="nsew", padx=10, pady=5)
 
-        self.tape_canvas = tk.Canvas(tape_card, height=40)
-        self.tape_scroll = ttk.Scrollbar(tape_card, orient="horizontal", command=self.tape_canvas.xview)
-        self.tape_canvas.configure(xscrollcommand=self.tape_scroll.set)
-
-        self.tape_frame = ttk.Frame(self.tape_canvas)
-        self.tape_canvas_window = self.tape_canvas.create_window((0, 0), window=self.tape_frame, anchor="nw")
-
-        self.tape_frame.bind("<Configure>", lambda e: self.tape_canvas.configure(scrollregion=self.tape_canvas.bbox("all")))
+        # Virtualized tape: a fixed pool of canvas items, one per visible cell slot
+        cell_step = self.CELL_SIZE + self.CELL_PAD
+        self.tape_canvas = tk.Canvas(
+            tape_card, height=self.CELL_SIZE + 2 * self.CELL_PAD,
+            width=self.TAPE_CELLS * cell_step + self.CELL_PAD, highlightthickness=0,
+        )
+        self.tape_scroll = ttk.Scrollbar(tape_card, orient="horizontal", command=self.__scroll_tape)
+        self.tape_canvas.bind("<Configure>", lambda e: self.__render_tape_view())
         self.tape_canvas.pack(fill="x", expand=True)
         self.tape_scroll.pack(fill="x")
 
-        self.tape_cells = {}
+        self.tape_slots = []        # (rect_id, text_id) per visible slot
+        self.tape_slot_cells = []   # (symbol, is_head) currently shown per slot
+        self.tape_view = ({}, 0, False)
+        self.tape_view_start = 0
+        self.tape_extent = (0, 0)
 
         self.status_label = ttk.Label(tape_card, text="State: INIT | Step: 0", font=("Helvetica", 12))
         self.status_label.pack()
@@ -179,9 +198,14 @@ class TuringGUI:
         self.delay_entry.insert(0, str(self.DELAY))
         self.delay_entry.grid(row=4, column=1, sticky="w", padx=5, pady=5)
 
-        # --- Row 5: Buttons ---
+        ttk.Label(control_frame, text="Run Mode:").grid(row=5, column=0, sticky="w")
+        self.run_mode = tk.StringVar(value=self.RUN_MODES[0])
+        ttk.Combobox(control_frame, textvariable=self.run_mode, values=self.RUN_MODES,
+                     state="readonly", width=20).grid(row=5, column=1, sticky="w", padx=5, pady=2)
+
+        # --- Row 6: Buttons ---
         btn_frame = ttk.Frame(control_frame)
-        btn_frame.grid(row=5, column=0, columnspan=2, pady=5)
+        btn_frame.grid(row=6, column=0, columnspan=2, pady=5)
 
         ttk.Button(btn_frame, text="Step", command=self.__step).grid(row=0, column=0, padx=4)
         self.run_button = ttk.Button(btn_frame, text="Run", command=self.__run)
@@ -274,19 +298,23 @@ class TuringGUI:
             messagebox.showerror("Invalid Input", "Please enter a valid step number.")
             return
 
+        with self.run_lock:
+            self.__show_step(step)
+
+    def __show_step(self, step):
         if 0 <= step <= self.step_count:
             self.history_slider.set(step)
             self.__seek_history(step)
 
             # Prev Step
-            prev = self.history[step - 1]["state"] if step > 0 else "--"
+            prev = self.history.state_at(step - 1) if step > 0 else "--"
 
             # Next Step
             if step + 1 < len(self.history):
-                next_state = self.history[step + 1]["state"]
+                next_state = self.history.state_at(step + 1)
             else:
                 next_state = "--"
-            current = self.history[step]["state"]
+            current = self.history.state_at(step)
 
             full_state = f"{prev} <- {current} -> {next_state}"
             self.step_index.config(text=f"[{step}]")
@@ -297,47 +325,108 @@ class TuringGUI:
 
     def __seek_history(self, val):
         index = int(float(val))
-        if index == self.step_count:
-            self.__draw_tape(self.cpu.tape, self.cpu.head_position, self.cpu.current_state, index)
-        elif 0 <= index < len(self.history):
-            state = self.history[index]
-            self.__draw_tape(state["tape"], state["head"], state["state"], index, highlight=True)
+        with self.run_lock:
+            if index == self.step_count:
+                self.__draw_tape(self.cpu.tape, self.cpu.head_position, self.cpu.current_state, index)
+            elif 0 <= index < len(self.history):
+                tape, head, state = self.history.config_at(index)
+                self.__draw_tape(tape, head, state, index, highlight=True)
+
+    def __max_allowed(self):
+        try:
+            return int(self.max_steps.get())
+        except ValueError:
+            return self.MAX_STEPS
+
+    def __advance(self, max_allowed):
+        """
+        Run one step and record it. Returns None, or why the machine cannot step:
+        ("max", None), ("halted", None) or ("stuck", error message). Makes no Tk
+        calls, so the fast-mode worker thread can use it.
+        """
+        if self.step_count >= max_allowed:
+            return "max", None
+        if self.cpu.current_state == self.cpu.halt_state:
+            return "halted", None
+
+        old_head = self.cpu.head_position
+        old_state = self.cpu.current_state
+        old_symbol = self.cpu.tape.get(old_head, self.cpu.blank_symbol)
+        try:
+            self.cpu._step_logic()
+        except TuringConfig.MissingTransitionError as e:
+            return "stuck", str(e)
+
+        self.step_count += 1
+        self.history.record(
+            old_head, old_symbol, self.cpu.tape.get(old_head, self.cpu.blank_symbol), old_state,
+            self.cpu.tape, self.cpu.head_position, self.cpu.current_state,
+        )
+        return None
+
+    def __report_stop(self, outcome, max_allowed):
+        reason, message = outcome
+        if reason == "max":
+            self.halt_label.config(text=f"Max steps ({max_allowed}) reached")
+        elif reason == "halted":
+            self.halt_label.config(text=f"Machine HALTED | Total Steps: {self.step_count}", foreground="green")
+        else:
+            messagebox.showerror("Transition Error", message)
+            self.halt_label.config(text=f"Machine STUCK | After {self.step_count} Steps", foreground="red")
+        self.__pause()
 
     def __step(self):
+        if self.worker is not None:
+            self.__pause()
+
         try:
             steps_to_run = int(self.step_entry.get())
         except ValueError:
             steps_to_run = self.BASE_STEP
 
-        try:
-            max_allowed = int(self.max_steps.get())
-        except ValueError:
-            max_allowed = self.MAX_STEPS
-
+        max_allowed = self.__max_allowed()
         for _ in range(steps_to_run):
-            self.history.append({
-                "tape": self.cpu.tape.copy(),
-                "head": self.cpu.head_position,
-                "state": self.cpu.current_state
-            })
-            if self.step_count >= max_allowed:
-                self.halt_label.config(text=f"Max steps ({max_allowed}) reached")
-                self.__pause()
+            outcome = self.__advance(max_allowed)
+            if outcome:
+                self.__report_stop(outcome, max_allowed)
                 break
 
-            if self.cpu.current_state == self.cpu.halt_state:
-                self.halt_label.config(text=f"Machine HALTED | Total Steps: {self.step_count}", foreground="green")
-                self.__pause()
-                break
+        self.history_slider.config(to=self.step_count)
+        self.history_slider.set(self.step_count)
+        self.__update_display()
 
-            try:
-                self.cpu._step_logic()
-                self.step_count += 1
-            except TuringConfig.MissingTransitionError as e:
-                messagebox.showerror("Transition Error", str(e))
-                self.halt_label.config(text=f"Machine STUCK | After {self.step_count} Steps", foreground="red")
-                self.__pause()
-                break
+    def __run_worker(self, max_allowed):
+        """Fast mode: step at full speed, WORKER_BATCH steps per lock hold, until stopped."""
+        while not self.stop_event.is_set():
+            with self.run_lock:
+                for _ in range(self.WORKER_BATCH):
+                    outcome = self.__advance(max_allowed)
+                    if outcome:
+                        self.worker_outcome = outcome
+                        return
+
+    def __poll_worker(self, max_allowed):
+        """Fast mode: render the current configuration FRAME_RATE times a second."""
+        self.poll_id = None
+        with self.run_lock:
+            self.history_slider.config(to=self.step_count)
+            self.history_slider.set(self.step_count)
+            self.__update_display()
+
+        if self.worker.is_alive():
+            self.poll_id = self.root.after(1000 // self.FRAME_RATE, self.__poll_worker, max_allowed)
+        elif self.worker_outcome:
+            self.__report_stop(self.worker_outcome, max_allowed)
+
+    def __stop_worker(self):
+        if self.worker is None:
+            return
+        self.stop_event.set()
+        self.worker.join()
+        self.worker = None
+        if self.poll_id is not None:
+            self.root.after_cancel(self.poll_id)
+            self.poll_id = None
 
         self.history_slider.config(to=self.step_count)
         self.history_slider.set(self.step_count)
@@ -357,53 +446,111 @@ class TuringGUI:
         self.__draw_tape(self.cpu.tape, self.cpu.head_position, self.cpu.current_state, self.step_count)
 
     def __draw_tape(self, tape_dict, head_pos, current_state, step_num, highlight=True):
-        for widget in self.tape_frame.winfo_children():
-            widget.destroy()
-        self.tape_cells.clear()
-
-        min_index = min(tape_dict.keys(), default=0)
-        max_index = max(tape_dict.keys(), default=0)
-        start = min(min_index, head_pos) - 7
-        end = max(max_index, head_pos) + 7
-
-        for i in range(start, end + 1):
-            symbol = tape_dict.get(i, self.cpu.blank_symbol)
-            lbl = tk.Label(self.tape_frame, text=symbol, width=2, height=1, font=("Courier", 16),
-                            relief="solid", borderwidth=0.2, bg="white")
-            if i == head_pos and highlight:
-                lbl.config(highlightbackground="blue", highlightcolor="blue",
-                            highlightthickness=2, font=("Courier", 16, "bold"))
-            lbl.grid(row=0, column=i - start, padx=2)
-            self.tape_cells[i] = lbl
-
-        self.tape_frame.update_idletasks()
-        self.tape_canvas.configure(scrollregion=self.tape_canvas.bbox("all"))
-
-        if head_pos in self.tape_cells:
-            cell_width = self.tape_cells[head_pos].winfo_width()
-            total_width = (end - start + 1) * (cell_width + 4)
-            canvas_width = self.tape_canvas.winfo_width()
-            scroll_to = max((head_pos - start) * (cell_width + 4) - canvas_width // 2, 0)
-            self.tape_canvas.xview_moveto(scroll_to / total_width)
+        self.tape_view = (tape_dict, head_pos, highlight)
+        low, high = self.tape_extent
+        self.tape_extent = (min(low, head_pos), max(high, head_pos))
+
+        # Recenter only when the head gets near the edge of the viewport
+        slots = self.__tape_slot_count()
+        if not self.tape_view_start + 2 <= head_pos < self.tape_view_start + slots - 2:
+            self.tape_view_start = head_pos - slots // 2
 
+        self.__render_tape_view()
         self.status_label.config(text=f"State: {current_state} | Step: {step_num}")
 
+    def __tape_slot_count(self):
+        width = self.tape_canvas.winfo_width()
+        if width <= 1:
+            width = int(self.tape_canvas.cget("width"))
+        return max(width // (self.CELL_SIZE + self.CELL_PAD), 1)
+
+    def __render_tape_view(self):
+        """Reconfigure only the visible slots whose cell differs from what they show."""
+        slots = self.__tape_slot_count()
+        cell_step = self.CELL_SIZE + self.CELL_PAD
+        while len(self.tape_slots) < slots:
+            x0 = len(self.tape_slots) * cell_step + self.CELL_PAD
+            rect = self.tape_canvas.create_rectangle(
+                x0, self.CELL_PAD, x0 + self.CELL_SIZE, self.CELL_PAD + self.CELL_SIZE,
+                fill="white", outline="gray", width=1,
+            )
+            text = self.tape_canvas.create_text(
+                x0 + self.CELL_SIZE // 2, self.CELL_PAD + self.CELL_SIZE // 2,
+                text="", font=("Courier", 16),
+            )
+            self.tape_slots.append((rect, text))
+            self.tape_slot_cells.append(None)
+
+        tape_dict, head_pos, highlight = self.tape_view
+        blank = self.cpu.blank_symbol
+        for i, (rect, text) in enumerate(self.tape_slots[:slots]):
+            pos = self.tape_view_start + i
+            cell = (tape_dict.get(pos, blank), highlight and pos == head_pos)
+            if self.tape_slot_cells[i] == cell:
+                continue
+            self.tape_slot_cells[i] = cell
+            symbol, is_head = cell
+            self.tape_canvas.itemconfigure(
+                text, text=symbol, font=("Courier", 16, "bold") if is_head else ("Courier", 16)
+            )
+            self.tape_canvas.itemconfigure(
+                rect, outline="blue" if is_head else "gray", width=3 if is_head else 1
+            )
+
+        first, total = self.__tape_scroll_range()
+        self.tape_scroll.set(
+            (self.tape_view_start - first) / total,
+            (self.tape_view_start - first + slots) / total,
+        )
+
+    def __tape_scroll_range(self):
+        """First scrollable tape index and number of scrollable cells (visited extent plus margin)."""
+        slots = self.__tape_slot_count()
+        low, high = self.tape_extent
+        first = min(low - slots // 2, self.tape_view_start)
+        last = max(high + slots // 2, self.tape_view_start + slots - 1)
+        return first, last - first + 1
+
+    def __scroll_tape(self, *args):
+        """Scrollbar command: shift the viewport instead of moving widgets."""
+        first, total = self.__tape_scroll_range()
+        slots = self.__tape_slot_count()
+        if args[0] == "moveto":
+            self.tape_view_start = first + round(float(args[1]) * total)
+        elif args[0] == "scroll":
+            amount = int(args[1])
+            if args[2] == "pages":
+                amount *= slots
+            self.tape_view_start += amount
+        self.__render_tape_view()
+
     def __run(self):
         self.running = True
         self.run_button.config(state="disabled")
         self.pause_button.config(state="normal")
-        self.__auto_step()
+        if self.run_mode.get() == self.RUN_MODES[0]:
+            self.__auto_step()
+            return
+
+        max_allowed = self.__max_allowed()
+        self.stop_event.clear()
+        self.worker_outcome = None
+        self.worker = threading.Thread(target=self.__run_worker, args=(max_allowed,), daemon=True)
+        self.worker.start()
+        self.__poll_worker(max_allowed)
 
     def __pause(self):
         self.running = False
+        self.__stop_worker()
         self.run_button.config(state="normal")
         self.pause_button.config(state="disabled")
 
     def __load(self):
+        self.__stop_worker()
         rules = self.rules_text.get("1.0", "end-1c").strip()
         self.initial_tape = self.tape_input.get()
         self.turing = TuringMachine(rules)
-        self.cpu = MachineLogic(self.turing.transition_rules)
+        self.cpu = MachineLogic(self.turing.transition_rules, transitions_dict=self.turing.transitions_dict)
         self.cpu._set_tape(self.initial_tape)
         self.cpu.input_tape = self.initial_tape
         self.step_count = 0
@@ -411,12 +558,15 @@ class TuringGUI:
         self.halt_label.config(text="")
         self.run_button.config(state="normal")
         self.pause_button.config(state="disabled")
-        self.history = []
+        self.history = StepHistory(self.KEYFRAME_INTERVAL, self.cpu.blank_symbol)
+        self.history.reset(self.cpu.tape, self.cpu.head_position, self.cpu.current_state)
         self.history_slider.config(to=0)
+        self.tape_extent = (0, max(len(self.initial_tape) - 1, 0))
         self.rules_no.config(text=f"[{self.cpu.rules_no}]")
         self.__update_display()
 
     def __hard_reset(self):
+        self.__stop_worker()
         self.cpu._set_tape(self.initial_tape)
         self.cpu.input_tape = self.initial_tape
         self.cpu.current_state = self.cpu.init_state
@@ -425,8 +575,10 @@ class TuringGUI:
         self.halt_label.config(text="")
         self.run_button.config(state="normal")
         self.pause_button.config(state="disabled")
-        self.history = []
+        self.history = StepHistory(self.KEYFRAME_INTERVAL, self.cpu.blank_symbol)
+        self.history.reset(self.cpu.tape, self.cpu.head_position, self.cpu.current_state)
         self.history_slider.config(to=0)
+        self.tape_extent = (0, max(len(self.initial_tape) - 1, 0))
         self.__update_display()
 
     def __copy_rules(self):
@@ -449,11 +601,13 @@ class TuringGUI:
         self.initial_tape = init_tape if init_tape else "||||"
         self.step_count = 0
         self.running = False
-        self.history = []
         self._build_gui()
         self.__load()
 
         self.root.mainloop()
+        if self.worker is not None:
+            self.stop_event.set()
+            self.worker.join()
 
         resources_used = [
             f"   Time run: {TuringConfig.get_timestamp() - self.init_time:.5f}s",
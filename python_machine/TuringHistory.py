@@ -0,0 +1,86 @@
+"""
+Delta-encoded step history with periodic keyframes.
+
+Instead of a full tape copy per step, every step stores only its write
+delta ``(old_head, old_symbol, new_symbol, old_state)``; the written
+position is always the head position before the move. A full keyframe
+(tape copy, head, state) is taken every ``keyframe_interval`` steps, and
+the configuration at any step is rebuilt from the nearest keyframe at or
+before it by replaying at most ``keyframe_interval - 1`` deltas.
+"""
+
+from TuringMachine import TuringConfig
+
+StepDelta = tuple[int, str, str, str]
+Keyframe = tuple[dict[int, str], int, str]
+
+
+class StepHistory:
+    """Step history of one run: deltas for every step, keyframes every N steps."""
+
+    def __init__(self, keyframe_interval: int = 512, blank_symbol: str = TuringConfig.BLANK) -> None:
+        if keyframe_interval < 1:
+            raise ValueError(f"Invalid keyframe_interval: {keyframe_interval}. Must be at least 1")
+        self.keyframe_interval = keyframe_interval
+        self.blank_symbol = blank_symbol
+        self.deltas: list[StepDelta] = []
+        self.keyframes: list[Keyframe] = []
+        self.head: int = 0
+        self.state: str = ""
+
+    def reset(self, tape: dict[int, str], head: int, state: str) -> None:
+        """Start a new history from the configuration at step 0."""
+        self.deltas = []
+        self.keyframes = [(tape.copy(), head, state)]
+        self.head = head
+        self.state = state
+
+    def record(
+        self,
+        old_head: int,
+        old_symbol: str,
+        new_symbol: str,
+        old_state: str,
+        tape: dict[int, str],
+        head: int,
+        state: str,
+    ) -> None:
+        """Append one step; ``tape``/``head``/``state`` are the configuration after it."""
+        self.deltas.append((old_head, old_symbol, new_symbol, old_state))
+        self.head = head
+        self.state = state
+        if len(self.deltas) % self.keyframe_interval == 0:
+            self.keyframes.append((tape.copy(), head, state))
+
+    def __len__(self) -> int:
+        """Number of recorded configurations: steps 0 .. len(deltas)."""
+        return len(self.deltas) + 1
+
+    def _check_step(self, step: int) -> None:
+        if not 0 <= step <= len(self.deltas):
+            raise IndexError(f"Step {step} out of range 0..{len(self.deltas)}")
+
+    def state_at(self, step: int) -> str:
+        self._check_step(step)
+        return self.deltas[step][3] if step < len(self.deltas) else self.state
+
+    def head_at(self, step: int) -> int:
+        self._check_step(step)
+        return self.deltas[step][0] if step < len(self.deltas) else self.head
+
+    def tape_at(self, step: int) -> dict[int, str]:
+        """Rebuild the tape at ``step`` from the nearest keyframe at or before it."""
+        self._check_step(step)
+        keyframe_index = step // self.keyframe_interval
+        tape = self.keyframes[keyframe_index][0].copy()
+        blank = self.blank_symbol
+        for position, _, new_symbol, _ in self.deltas[keyframe_index * self.keyframe_interval:step]:
+            if new_symbol == blank:
+                tape.pop(position, None)
+            else:
+                tape[position] = new_symbol
+        return tape
+
+    def config_at(self, step: int) -> Keyframe:
+        """Return ``(tape, head, state)`` at ``step``."""
+        return self.tape_at(step), self.head_at(step), self.state_at(step)
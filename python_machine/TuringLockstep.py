@@ -0,0 +1,171 @@
+"""
+NumPy lockstep engine: advance many tapes of one machine at once.
+
+K tapes live in a 2D ``uint8`` array of symbol ids sharing one origin column,
+with head positions and state rows as 1D arrays. Every iteration advances all
+still-running lanes by one step through the ``CompiledMachine`` table turned
+into NumPy lookup arrays; halted and stuck lanes are masked out. Because all
+lanes step together, a lane's step count is the iteration at which it stopped.
+
+The tape array is regrown (doubling towards the overflowing side) whenever a
+running head reaches an edge. The shared width is capped at MAX_TAPE_LEN, and
+lanes that need more room than that fail with ``TapeLimitError``.
+
+Requires numpy; this module is only imported when the lockstep engine is used.
+"""
+
+import numpy as np
+
+from TuringMachine import TuringConfig
+from TuringCompiler import CompiledMachine
+from TuringBatch import BatchResult
+
+
+class LockstepMachine:
+    """Vectorized run of one CompiledMachine over a batch of tapes."""
+
+    MIN_WIDTH = 64
+
+    def __init__(self, compiled: CompiledMachine, max_len: int = TuringConfig.MAX_TAPE_LEN) -> None:
+        self.compiled = compiled
+        self.max_len = max_len
+
+    def _lookup_arrays(self) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        table = self.compiled.table
+        valid = np.array([entry is not None for entry in table], dtype=bool)
+        next_row = np.array([entry[0] if entry else 0 for entry in table], dtype=np.int64)
+        write = np.array([entry[1] if entry else 0 for entry in table], dtype=np.uint8)
+        delta = np.array([entry[2] if entry else 0 for entry in table], dtype=np.int64)
+        return valid, next_row, write, delta
+
+    def run(self, input_tapes: list[str], *, MAX_STEPS: int = 1_000_000) -> list[BatchResult]:
+        """Return ``(input_tape, result_tape, steps, error)`` per tape, in input order."""
+        compiled = self.compiled
+        lanes = len(input_tapes)
+        errors: list[str | None] = [None] * lanes
+        cells: list[list[int]] = []
+        for lane, input_tape in enumerate(input_tapes):
+            try:
+                cells.append(compiled.encode_tape(input_tape))
+            except TuringConfig.InvalidSymbolError as e:
+                errors[lane] = f"{type(e).__name__}: {e}"
+                cells.append([])
+            if len(cells[-1]) > self.max_len:
+                errors[lane] = f"TapeLimitError: Input tape length {len(cells[-1])} exceeds MAX_TAPE_LEN {self.max_len}"
+                cells[-1] = []
+        if compiled.width > 256:
+            raise ValueError(f"Lockstep tapes hold at most 256 symbols, alphabet has {compiled.width}")
+
+        valid, next_row, write, delta = self._lookup_arrays()
+        halt_row = compiled.state_ids[compiled.halt_state] * compiled.width
+
+        # Headroom on both sides of the longest input, as DenseTape does
+        longest = max((len(lane_cells) for lane_cells in cells), default=0)
+        width = min(longest + max(longest, self.MIN_WIDTH), self.max_len)
+        origin = (width - longest) // 2
+        tapes = np.zeros((lanes, width), dtype=np.uint8)
+        for lane, lane_cells in enumerate(cells):
+            tapes[lane, origin:origin + len(lane_cells)] = lane_cells
+
+        # Running lanes are kept compacted: lane ids, head columns and state rows
+        active = np.flatnonzero(np.array([error is None for error in errors], dtype=bool))
+        lane_heads = np.full(active.size, origin, dtype=np.int64)
+        lane_rows = np.full(active.size, compiled.state_ids[compiled.init_state] * compiled.width, dtype=np.int64)
+        rows = np.zeros(lanes, dtype=np.int64)
+        steps = np.zeros(lanes, dtype=np.int64)
+        stuck = np.zeros(lanes, dtype=bool)
+        stuck_symbols = np.zeros(lanes, dtype=np.uint8)
+
+        flat = tapes.reshape(-1)
+        cells_at = active * width + lane_heads
+        step_count = 0
+        while active.size and step_count < MAX_STEPS:
+            symbols_read = flat[cells_at]
+            index = lane_rows + symbols_read
+            ok = valid[index]
+            if not ok.all():
+                done = ~ok
+                finished = active[done]
+                steps[finished] = step_count
+                rows[finished] = lane_rows[done]
+                stuck[finished] = lane_rows[done] != halt_row
+                stuck_symbols[finished] = symbols_read[done]
+                active, lane_heads, cells_at, index = active[ok], lane_heads[ok], cells_at[ok], index[ok]
+
+            flat[cells_at] = write[index]
+            lane_rows = next_row[index]
+            moves = delta[index]
+            lane_heads += moves
+            cells_at += moves
+            step_count += 1
+
+            if lane_heads.size and (lane_heads.min() < 0 or lane_heads.max() >= width):
+                tapes, width, shift, off_tape = self._regrow(tapes, lane_heads, width)
+                if off_tape is not None:
+                    failed = active[off_tape]
+                    steps[failed] = step_count
+                    for lane in failed:
+                        errors[lane] = f"TapeLimitError: Tape exceeded MAX_TAPE_LEN of {self.max_len} cells"
+                    kept = ~off_tape
+                    active, lane_heads, lane_rows = active[kept], lane_heads[kept], lane_rows[kept]
+                lane_heads += shift
+                flat = tapes.reshape(-1)
+                cells_at = active * width + lane_heads
+
+        steps[active] = step_count
+        rows[active] = lane_rows
+        return self._collect(input_tapes, tapes, rows, steps, stuck, stuck_symbols, active, errors, MAX_STEPS)
+
+    def _regrow(
+        self, tapes: np.ndarray, lane_heads: np.ndarray, width: int
+    ) -> tuple[np.ndarray, int, int, np.ndarray | None]:
+        """
+        Double the tape towards the overflowing side(s), capped at ``max_len``.
+
+        Returns ``(tapes, width, shift, off_tape)``: ``shift`` is added to every
+        head column, ``off_tape`` masks the lanes that cannot fit (the tape is
+        left as is) or is ``None``.
+        """
+        left = max(int(-lane_heads.min()), 0)
+        right = max(int(lane_heads.max()) - width + 1, 0)
+        if left:
+            left = max(left, min(width, self.max_len - width - right))
+        if right:
+            right = max(right, min(width, self.max_len - width - left))
+
+        if width + left + right > self.max_len:
+            return tapes, width, 0, (lane_heads < 0) | (lane_heads >= width)
+
+        tapes = np.pad(tapes, ((0, 0), (left, right)))
+        return tapes, width + left + right, left, None
+
+    def _collect(self, input_tapes, tapes, rows, steps, stuck, stuck_symbols, active, errors, MAX_STEPS):
+        compiled = self.compiled
+        symbols = compiled.symbols
+        latin = all(ord(symbol) < 256 for symbol in symbols)
+        table = bytes(ord(symbol) for symbol in symbols) + bytes(256 - len(symbols)) if latin else b""
+        # Lanes that halt on the very last allowed step are still in ``active``
+        halt_row = compiled.state_ids[compiled.halt_state] * compiled.width
+        running = np.zeros(len(input_tapes), dtype=bool)
+        running[active] = rows[active] != halt_row
+
+        results: list[BatchResult] = []
+        for lane, input_tape in enumerate(input_tapes):
+            if errors[lane] is not None:
+                results.append((input_tape, None, int(steps[lane]), errors[lane]))
+                continue
+
+            used = tapes[lane].tobytes().strip(b"\x00")
+            if latin:
+                final_tape = used.translate(table).decode("latin-1")
+            else:
+                final_tape = "".join([symbols[symbol_id] for symbol_id in used])
+
+            if stuck[lane]:
+                error = compiled._missing_transition(int(rows[lane]), int(stuck_symbols[lane]), input_tape)
+                results.append((input_tape, None, int(steps[lane]), f"{type(error).__name__}: {error}"))
+            elif running[lane]:
+                results.append((input_tape, final_tape, int(steps[lane]), f"Max steps reached: {MAX_STEPS}"))
+            else:
+                results.append((input_tape, final_tape, int(steps[lane]), None))
+        return results
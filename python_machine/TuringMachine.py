@@ -1,4 +1,9 @@
-import copy, time, psutil, click
+import copy, sys, time
+
+# Rolling tape hash of MachineLogic._run_detecting_loops
+_HASH_MOD = (1 << 61) - 1
+_HASH_BASE = 1_000_003
+_HASH_BASE_INVERSE = pow(_HASH_BASE, -1, _HASH_MOD)
 
 class TuringConfig:
     LEFT  = "L"
@@ -11,6 +16,9 @@ class TuringConfig:
     MAX_STATE_SIZE = 32        # 32 Chars
     TRANSITION_SIZE = 710_000  # 710,000 Chars
 
+    ENGINES = ("dict", "compiled", "macro", "codegen")
+    TAPES = ("dense", "sparse")
+
     TransitionType = tuple[str, str, str, str, str]
 
     InvalidSymbolError = type('InvalidSymbolError', (Exception,), {
@@ -33,12 +41,30 @@ class TuringConfig:
     })
     """Exception raised when a transition is missing (parsing)."""
 
+    TapeLimitError = type('TapeLimitError', (Exception,), {
+        '__doc__': 'Tape exceeded MAX_TAPE_LEN (running)'
+    })
+    """Exception raised when the tape grows past MAX_TAPE_LEN (running)."""
+
+    class NonHaltingError(Exception):
+        """Exception raised when a configuration provably repeats (running)."""
+
+        def __init__(self, message: str, cycle_length: int, cycle_start: int, shift: int = 0) -> None:
+            super().__init__(message)
+            self.cycle_length = cycle_length
+            self.cycle_start = cycle_start
+            # Cells the configuration moves per cycle; 0 for a plain repeat
+            self.shift = shift
+
     @staticmethod
     def get_timestamp() -> float:
         return time.time()
 
     @staticmethod
     def get_current_memory_mb() -> float:
+        # psutil is only needed for resource reporting, so it is imported on first use
+        import psutil
+
         process = psutil.Process()
         mem_bytes = process.memory_info().rss  # Resident Set Size (physical memory)
         return round(mem_bytes / (1024 * 1024), 2)  # Convert bytes to MB
@@ -52,6 +78,7 @@ class MachineLogic:
         init_state: str = "INIT",
         halt_state: str = "HALT",
         blank_symbol: str = TuringConfig.BLANK,
+        transitions_dict: dict[str, dict[str, tuple[str, str, str]]] | None = None,
     ) -> None:
 
         self.init_state = init_state
@@ -62,15 +89,18 @@ class MachineLogic:
         self.MAX_STATE_SIZE = TuringConfig.MAX_STATE_SIZE
 
         self.transitions_list = transitions_list
-        self.transitions_dict = self._build_transition_dict(
-            transitions_list, init_state, halt_state
-        )
+        # A table already built and validated by TuringParser.parse_rules is used as is
+        if transitions_dict is None:
+            transitions_dict = self._build_transition_dict(transitions_list, init_state, halt_state)
+        self.transitions_dict = transitions_dict
         self.rules_no = len(self.transitions_list)
 
         # Initialize Tape
         self.head_position: int = None
         self.current_state: str = None
         self.tape: dict[int, str] = {}
+        self.tape_low: int = 0
+        self.tape_high: int = 0
 
         self.running = True
 
@@ -154,6 +184,8 @@ class MachineLogic:
             idx: symbol for idx, symbol in enumerate(input_tape)
             if symbol != self.blank_symbol
             }
+        self.tape_low = 0
+        self.tape_high = max(len(input_tape) - 1, 0)
 
     def _get_tape_boundaries(self, window: int = 10) -> tuple[int, int]:
         if self.tape:
@@ -215,17 +247,376 @@ class MachineLogic:
 
         self.current_state = new_state
         self.head_position += shift
+        if self.head_position < self.tape_low:
+            self.tape_low = self.head_position
+        elif self.head_position > self.tape_high:
+            self.tape_high = self.head_position
+
+    def tape_usage(self) -> tuple[int, int]:
+        """Tape cells spanned by the head so far and the bytes of the tape dict."""
+        return self.tape_high - self.tape_low + 1, sys.getsizeof(self.tape)
+
+    def _render_tape(self) -> str:
+        """Materialize the stripped tape between the tracked bounds."""
+        tape, blank = self.tape, self.blank_symbol
+        tape_str = "".join(
+            [tape.get(i, blank) for i in range(self.tape_low, self.tape_high + 1)]
+        )
+        return tape_str.strip(blank)
+
+    def _run_headless(self, MAX_STEPS: int) -> int:
+        """
+        Step the machine without rendering until it halts or hits MAX_STEPS.
+
+        The tape window is tracked incrementally in ``tape_low``/``tape_high``
+        (every write happens under the head, so the visited head range bounds
+        the used tape) instead of scanning the tape keys on every step.
+        """
+        transitions = self.transitions_dict
+        tape = self.tape
+        blank = self.blank_symbol
+        halt_state = self.halt_state
+        shifts = {TuringConfig.LEFT: -1, TuringConfig.RIGHT: +1}
+
+        state = self.current_state
+        head = self.head_position
+        low, high = self.tape_low, self.tape_high
+
+        step_count = 0
+        try:
+            while step_count < MAX_STEPS:
+                if state == halt_state:
+                    self.running = False
+                    break
+
+                state_transitions = transitions.get(state)
+                if not state_transitions:
+                    raise TuringConfig.MissingTransitionError(
+                        f"No transitions for state {state} with input tape {self.input_tape}"
+                    )
+
+                current_symbol = tape.get(head, blank)
+                transition = state_transitions.get(current_symbol)
+                if not transition:
+                    raise TuringConfig.MissingTransitionError(
+                        f"No transition for symbol {current_symbol or blank} "
+                        f"in state {state} with input tape {self.input_tape}"
+                    )
+
+                state, new_symbol, move_direction = transition
+                if new_symbol == blank:
+                    tape.pop(head, None)
+                else:
+                    tape[head] = new_symbol
+
+                head += shifts[move_direction]
+                if head < low:
+                    low = head
+                elif head > high:
+                    high = head
+                step_count += 1
+        finally:
+            self.current_state = state
+            self.head_position = head
+            self.tape_low, self.tape_high = low, high
+            # Also set when a MissingTransitionError cuts the run short
+            self.steps_run = step_count
+
+        return step_count
+
+    def iter_steps(self, input_tape: str | None = None, *, MAX_STEPS: int = 1_000_000):
+        """
+        Step the machine and yield a StepEvent per step, until it halts or hits MAX_STEPS.
+
+        With ``input_tape`` the run starts over on that tape, otherwise it
+        continues from the current configuration, which needs an earlier run
+        or ``iter_steps(input_tape)`` call. The machine attributes are
+        up to date at every yield, so the consumer can look at ``tape`` too.
+        Raises MissingTransitionError like ``run_logic`` when stuck.
+        """
+        from TuringTrace import StepEvent
+
+        if input_tape is not None:
+            self.input_tape = input_tape
+            self._set_tape(input_tape)
+        elif self.current_state is None:
+            raise ValueError("No tape loaded yet: pass input_tape to start a run")
+
+        transitions = self.transitions_dict
+        tape = self.tape
+        blank = self.blank_symbol
+        halt_state = self.halt_state
+        shifts = {TuringConfig.LEFT: -1, TuringConfig.RIGHT: +1}
+
+        for step in range(1, MAX_STEPS + 1):
+            state = self.current_state
+            if state == halt_state:
+                self.running = False
+                return
+            head = self.head_position
+            read = tape.get(head, blank)
+            transition = transitions.get(state, {}).get(read)
+            if not transition:
+                self._step_logic()  # raises the usual MissingTransitionError
+
+            new_state, new_symbol, move_direction = transition
+            if new_symbol == blank:
+                tape.pop(head, None)
+            else:
+                tape[head] = new_symbol
+
+            new_head = self.head_position = head + shifts[move_direction]
+            self.current_state = new_state
+            if new_head < self.tape_low:
+                self.tape_low = new_head
+            elif new_head > self.tape_high:
+                self.tape_high = new_head
+            yield StepEvent(step, state, head, read, new_symbol, move_direction, new_state)
+
+        if self.current_state == halt_state:
+            self.running = False
+
+    def _run_profiled(self, MAX_STEPS: int, profile) -> int:
+        """Headless run through ``MachineProfile.run``, which counts while it steps."""
+        state, head, low, high, step_count, stuck = profile.run(
+            self.transitions_dict, self.tape, self.blank_symbol, self.halt_state,
+            self.current_state, self.head_position, self.tape_low, self.tape_high, MAX_STEPS,
+        )
+        self.current_state, self.head_position = state, head
+        self.tape_low, self.tape_high = low, high
+        if state == self.halt_state:
+            self.running = False
+        if stuck:
+            # Raises the same MissingTransitionError as the uninstrumented loops
+            self._step_logic()
+        return step_count
+
+    def _clone(self) -> "MachineLogic":
+        clone = copy.copy(self)
+        clone.tape = self.tape.copy()
+        return clone
+
+    def _start_tape_hash(self) -> None:
+        """
+        Set ``tape_weights`` and ``tape_digest`` for ``_run_hashed``.
+
+        The digest is a polynomial hash of the tape relative to the head,
+        sum(weight * BASE**(position - head)), so configurations that are equal
+        up to translation get the same digest. Blank cells weigh 0.
+        """
+        transitions = self.transitions_dict
+        symbols = {symbol for state_transitions in transitions.values() for symbol in state_transitions}
+        symbols.update(new_symbol for state_transitions in transitions.values()
+                       for _, new_symbol, _ in state_transitions.values())
+        symbols.update(self.tape.values())
+        symbols.discard(self.blank_symbol)
+        weights = {symbol: weight for weight, symbol in enumerate(sorted(symbols), 1)}
+        weights[self.blank_symbol] = 0
+
+        # Horner's rule from the rightmost cell; gaps of blanks cost one pow
+        digest, previous = 0, None
+        for position in sorted(self.tape, reverse=True):
+            scale = 1 if previous is None else pow(_HASH_BASE, previous - position, _HASH_MOD)
+            digest = (digest * scale + weights[self.tape[position]]) % _HASH_MOD
+            previous = position
+        if previous is not None:
+            digest = digest * pow(_HASH_BASE, previous - self.head_position, _HASH_MOD) % _HASH_MOD
+        self.tape_weights = weights
+        self.tape_digest = digest
+
+    def _run_hashed(self, MAX_STEPS: int) -> int:
+        """
+        ``_run_headless`` that also keeps ``tape_digest`` up to date.
+
+        A write adds the weight difference at offset 0 and a move rescales
+        every offset by one power of the base, so each step costs O(1).
+        """
+        transitions = self.transitions_dict
+        tape = self.tape
+        blank = self.blank_symbol
+        halt_state = self.halt_state
+        shifts = {TuringConfig.LEFT: -1, TuringConfig.RIGHT: +1}
+        rolls = {TuringConfig.LEFT: _HASH_BASE, TuringConfig.RIGHT: _HASH_BASE_INVERSE}
+        weights = self.tape_weights
+
+        state = self.current_state
+        head = self.head_position
+        low, high = self.tape_low, self.tape_high
+        digest = self.tape_digest
+
+        step_count = 0
+        try:
+            while step_count < MAX_STEPS:
+                if state == halt_state:
+                    self.running = False
+                    break
+
+                state_transitions = transitions.get(state)
+                if not state_transitions:
+                    break
+                current_symbol = tape.get(head, blank)
+                transition = state_transitions.get(current_symbol)
+                if not transition:
+                    break
+
+                state, new_symbol, move_direction = transition
+                if new_symbol == blank:
+                    tape.pop(head, None)
+                else:
+                    tape[head] = new_symbol
+                digest = (digest + weights[new_symbol] - weights[current_symbol]) * rolls[move_direction] % _HASH_MOD
+
+                head += shifts[move_direction]
+                if head < low:
+                    low = head
+                elif head > high:
+                    high = head
+                step_count += 1
+        finally:
+            self.current_state = state
+            self.head_position = head
+            self.tape_low, self.tape_high = low, high
+            self.tape_digest = digest
+            self.steps_run = step_count
+
+        if step_count < MAX_STEPS and state != halt_state:
+            # Raises the same MissingTransitionError as the other loops
+            self._step_logic()
+        return step_count
+
+    def _same_configuration(self, other: "MachineLogic") -> bool:
+        """Whether ``other`` is in this configuration up to translation; digests are compared first."""
+        if (
+            self.tape_digest != other.tape_digest
+            or self.current_state != other.current_state
+            or len(self.tape) != len(other.tape)
+        ):
+            return False
+        shift = other.head_position - self.head_position
+        return {position + shift: symbol for position, symbol in self.tape.items()} == other.tape
+
+    def _run_detecting_loops(self, MAX_STEPS: int, check_interval: int) -> int:
+        """
+        Headless run that raises NonHaltingError once a configuration repeats.
+
+        Every ``check_interval`` steps the configuration is fed to Brent's cycle
+        detection, which only ever keeps one saved configuration. Steps keep a
+        rolling tape hash, so a check is an O(1) comparison and the tapes are
+        only compared cell by cell when the hashes match. The exact cycle
+        length and the step where the cycle is entered are then found with
+        bulk replays on copies of the machine.
+        """
+        self._start_tape_hash()
+        start = self._clone()
+        saved, saved_step = start, 0
+        power = lam = 1
+        step_count = 0
+        while step_count < MAX_STEPS:
+            step_count += self._run_hashed(min(check_interval, MAX_STEPS - step_count))
+            if self.current_state == self.halt_state:
+                break
+
+            if self._same_configuration(saved):
+                cycle_length = self._shortest_period(step_count - saved_step)
+                cycle_start = self._find_cycle_start(start, cycle_length, saved_step)
+                raise TuringConfig.NonHaltingError(
+                    f"Machine does not halt: configuration repeats every {cycle_length} steps "
+                    f"from step {cycle_start} with input tape {self.input_tape}",
+                    cycle_length, cycle_start,
+                )
+
+            if lam == power:
+                saved, saved_step = self._clone(), step_count
+                power *= 2
+                lam = 0
+            lam += 1
+        return step_count
+
+    def _shortest_period(self, period: int) -> int:
+        """
+        Shortest cycle length, given that the configuration repeats after ``period`` steps.
+
+        Every repeat length is a multiple of the shortest one, so it is found
+        by dividing out the prime factors of ``period`` that still give a repeat.
+        """
+        factor, remaining = 2, period
+        while remaining > 1:
+            if factor * factor > remaining:
+                factor = remaining
+            if remaining % factor == 0:
+                while remaining % factor == 0:
+                    remaining //= factor
+                while period % factor == 0:
+                    probe = self._clone()
+                    probe._run_hashed(period // factor)
+                    if not probe._same_configuration(self):
+                        break
+                    period //= factor
+            factor += 1
+        return period
+
+    def _find_cycle_start(self, start: "MachineLogic", cycle_length: int, upper_bound: int) -> int:
+        """
+        First step whose configuration comes back ``cycle_length`` steps later.
+
+        Once two configurations ``cycle_length`` steps apart are equal, all
+        later pairs are, and the pair at ``upper_bound`` is. So the step is
+        binary searched: a tortoise replay from ``start`` and a hare
+        ``cycle_length`` steps ahead are advanced in bulk by half the remaining
+        range, which replays about ``upper_bound`` steps in total.
+        """
+        tortoise = start._clone()
+        hare = start._clone()
+        hare._run_hashed(cycle_length)
+        if tortoise._same_configuration(hare):
+            return 0
+
+        low, high = 0, upper_bound
+        while high - low > 1:
+            middle = (low + high) // 2
+            next_tortoise, next_hare = tortoise._clone(), hare._clone()
+            next_tortoise._run_hashed(middle - low)
+            next_hare._run_hashed(middle - low)
+            if next_tortoise._same_configuration(next_hare):
+                high = middle
+            else:
+                tortoise, hare, low = next_tortoise, next_hare, middle
+        return high
 
     def run_logic(
         self,
         input_tape: str,
         *,
         MAX_STEPS: int = 1_000_000,
-        visualize: bool = False
+        visualize: bool = False,
+        detect_loops: bool = False,
+        loop_check_interval: int = 256,
+        detect_translations: bool = False,
+        profile=None,
     ) -> tuple[str, int, int]:
 
+        if profile is not None and (visualize or detect_loops or detect_translations):
+            raise ValueError("profile only applies to plain headless runs")
+        if visualize and (detect_loops or detect_translations):
+            raise ValueError("detect_loops and detect_translations only apply to headless runs")
+
+        if detect_translations:
+            if detect_loops:
+                raise ValueError("Use either detect_loops or detect_translations, not both")
+            from TuringDetect import TranslatedCyclerDetector
+            return TranslatedCyclerDetector(self).run(input_tape, MAX_STEPS=MAX_STEPS)
+
         self.input_tape = input_tape
         self._set_tape(input_tape)
+        if not visualize:
+            if detect_loops:
+                step_count = self._run_detecting_loops(MAX_STEPS, loop_check_interval)
+            elif profile is not None:
+                step_count = self._run_profiled(MAX_STEPS, profile)
+            else:
+                step_count = self._run_headless(MAX_STEPS)
+            return self._render_tape(), step_count, len(self.transitions_list)
+
         self._print_tape_state(visualize)
 
         step_count = 0
@@ -243,6 +634,8 @@ class MachineLogic:
         return tape, step_count, len(self.transitions_list)
 
     def run_step(self, input_tape, visualize: bool = True, MAX_STEPS=1_000_000):
+        import click
+
         print("Turing Machine Initialized:")
         self.input_tape = input_tape
         self._set_tape(input_tape)
@@ -289,11 +682,34 @@ class TuringMachine:
     BLANK = TuringConfig.BLANK
     COMMENT_PREFIX = TuringConfig.COMMENT_PREFIX
 
-    def __init__(self, instructions):
+    def __init__(self, instructions, cache=None):
+        """
+        cache: optional TuringCache.RuleCache. Rule sets already in it (same
+        normalized text and parser configuration) skip parsing and validation.
+        """
         self.instructions = instructions
         self.init_time = TuringConfig.get_timestamp()
-        self.init_memory = TuringConfig.get_current_memory_mb()
-        self.transition_rules = self.parse_transition_rules(instructions)
+        self.stats = None
+
+        parse_start = time.perf_counter()
+        self._load_rules(instructions, cache)
+        self.parse_time = time.perf_counter() - parse_start
+
+    def _load_rules(self, instructions, cache) -> None:
+        if cache is None:
+            self.transition_rules = self.parse_transition_rules(instructions)
+            return
+
+        key = cache.key(
+            instructions, "INIT", "HALT", self.BLANK, self.LEFT, self.RIGHT, self.COMMENT_PREFIX,
+            TuringConfig.MAX_STATES, TuringConfig.MAX_STATE_SIZE,
+        )
+        entry = cache.get(key)
+        if entry is None:
+            self.transition_rules = self.parse_transition_rules(instructions)
+            cache.put(key, self.transition_rules, self.transitions_dict)
+        else:
+            self.transition_rules, self.transitions_dict = entry
 
     def parse_transition_rules(
         self,
@@ -308,64 +724,421 @@ class TuringMachine:
         Returns:
             A list of transition tuples:
             (currentState, currentSymbol, newState, newSymbol, moveDirection)
+            The validated lookup table is kept in self.transitions_dict, so
+            MachineLogic can skip rebuilding and revalidating it.
         Raises:
-            ValueError: If a rule is invalid (e.g., wrong number of tokens or invalid direction).
+            InvalidTransitionError / InvalidSymbolError: listing every invalid rule with its
+            line and column (exception.errors holds them as TuringParser.RuleError).
         """
+        from TuringParser import parse_rules
 
-        transitions_list: list[TuringConfig.TransitionType] = []
-        raw_rule_list = transition_rules_str.split("\n")
-        for raw_line in raw_rule_list:
-            line = raw_line.strip()
-            if not line or line.startswith(self.COMMENT_PREFIX):
-                continue
-
-            # Remove inline comments
-            line = line.split(self.COMMENT_PREFIX, 1)[0].strip()
-            values = [val for val in line.split(" ") if val.strip()]
-
-            if len(values) != 5:
-                raise TuringConfig.InvalidTransitionError(
-                    f"Invalid transition: {values}. Expected 5 elements got {len(values)}  ",
-                )
+        parsed = parse_rules(
+            transition_rules_str,
+            left=self.LEFT, right=self.RIGHT, comment_prefix=self.COMMENT_PREFIX,
+            max_states=TuringConfig.MAX_STATES, max_state_size=TuringConfig.MAX_STATE_SIZE,
+        )
+        parsed.raise_for_errors({
+            "transition": TuringConfig.InvalidTransitionError,
+            "symbol": TuringConfig.InvalidSymbolError,
+            "state": TuringConfig.InvalidSymbolError,
+        })
+        self.transitions_dict = parsed.transitions_dict
+        return parsed.transitions
+
+    def analyze(self, init_tape=None):
+        """
+        Static reachability analysis of the rules (see TuringAnalysis.analyze_rules).
 
-            current_state, current_symbol, new_state, new_symbol, direction = values
-            if direction not in (self.LEFT, self.RIGHT):
-                raise TuringConfig.InvalidTransitionError(f"Invalid moveDirection: {direction}. Must be L or R")
+        With init_tape the input alphabet is that tape's symbols, otherwise any
+        symbol the rules read. The result lists the reachable states, the
+        (state, symbol) pairs that may raise MissingTransitionError, the dead
+        rules and the tape alphabet; report() formats it.
+        """
+        from TuringAnalysis import analyze_rules
 
-            for symbol, label in [(current_symbol, "current"), (new_symbol, "new")]:
-                if len(symbol) != 1:
-                    raise TuringConfig.InvalidSymbolError(f"Invalid {label}_symbol: {symbol!r}. Must be a single character.")
+        return analyze_rules(self.transitions_dict, "INIT", "HALT", self.BLANK, init_tape)
 
-            transitions_list.append((current_state, current_symbol, new_state, new_symbol, direction))
-        return transitions_list
+    def _make_cpu(self) -> MachineLogic:
+        """MachineLogic over the parsed rules, reusing the already validated table."""
+        return MachineLogic(self.transition_rules.copy(), transitions_dict=self.transitions_dict)
 
-    def run_machine(self, init_tape, play_type: int = 0, visualize: bool = True):
+    def run_machine(
+        self,
+        init_tape,
+        play_type: int = 0,
+        visualize: bool = True,
+        engine: str = "dict",
+        tape_type: str | None = None,
+        detect_loops: bool = False,
+        detect_translations: bool = False,
+        profile: bool = False,
+        trace_memory: bool = False,
+        MAX_STEPS: int = 1_000_000,
+        memo=None,
+        prune: bool = False,
+    ):
         """
         Run the Turing machine on the initial tape with optional visualization.
         0: Auto_play
         1: Manual_play
+
+        engine selects the headless auto-play interpreter:
+            "dict":     MachineLogic stepping over the nested transitions dict
+            "compiled": CompiledMachine over the integer-compiled table
+            "macro":    MacroMachine stepping whole tape blocks with cached macro transitions
+            "codegen":  CodegenMachine running Python source generated for this rule set
+        tape_type selects the compiled engine's tape storage:
+            "dense":    bytearray tape growing in both directions (default)
+            "sparse":   dict tape holding only non-blank cells
+        detect_loops stops a headless dict-engine run early with
+        TuringConfig.NonHaltingError once its configuration repeats;
+        detect_translations does the same for cycles that drift along the tape.
+        profile runs the headless dict engine through a TuringProfile.MachineProfile,
+        appends its sorted hot-transition report to the results and keeps it
+        in self.profile (self.profile.to_json() for the JSON export).
+
+        Resource figures come from a TuringStats.RunStats kept in self.stats:
+        parse, compile and execution time (wall and CPU), steps/sec and the tape
+        footprint; trace_memory adds the tracemalloc peak of compile plus run.
+
+        memo: optional TuringMemo.ResultMemo for plain headless runs. An outcome
+        already stored for the same normalized rules, tape and MAX_STEPS is
+        returned (or its MissingTransitionError re-raised) without running;
+        new outcomes are stored in it. A TapeLimitError depends on the engine's
+        tape, so it is never stored and a later run tries again.
+
+        prune compiles the compiled, macro and codegen engines from the table
+        without the rules TuringAnalysis finds unreachable on this input tape,
+        so their tables only span the reachable states and the alphabet used.
         """
+        if engine not in TuringConfig.ENGINES:
+            raise ValueError(f"Unknown engine {engine!r}. Must be one of {TuringConfig.ENGINES}")
+        if engine != "compiled" and tape_type is not None:
+            raise ValueError("tape_type only applies to the compiled engine")
+        if prune and engine == "dict":
+            raise ValueError("prune only applies to the compiled, macro and codegen engines")
+
         transition_rules = self.transition_rules.copy()
 
-        cpu = MachineLogic(transition_rules)
-        if play_type == 0:
-            final_tape, steps, rules_no = cpu.run_logic(init_tape, visualize=visualize)
-        elif play_type == 1:
-            final_tape, steps, rules_no = cpu.run_step(init_tape, visualize=visualize)
+        if (detect_loops or detect_translations) and (engine != "dict" or play_type != 0 or visualize):
+            raise ValueError(
+                "detect_loops and detect_translations only support the headless dict engine (play_type=0, visualize=False)"
+            )
 
-        resources_used = [
-            f"   Time run: {TuringConfig.get_timestamp() - self.init_time:.5f}s",
+        machine_profile = None
+        if profile:
+            if engine != "dict" or play_type != 0 or visualize:
+                raise ValueError("profile only supports the headless dict engine (play_type=0, visualize=False)")
+            from TuringProfile import MachineProfile
+            machine_profile = self.profile = MachineProfile()
+
+        if memo is not None:
+            if play_type != 0 or visualize or profile or detect_loops or detect_translations:
+                raise ValueError("memo only applies to plain headless runs (play_type=0, visualize=False)")
+            memoized = memo.get(transition_rules, init_tape, MAX_STEPS)
+            if memoized is not None:
+                return self._memoized_result(transition_rules, engine, memoized)
+
+        from TuringStats import RunStats, start_tracing, stop_tracing
+
+        stats = self.stats = RunStats(engine, self.parse_time)
+        tracing = start_tracing() if trace_memory else None
+        try:
+            compile_start = time.perf_counter()
+            cpu = runner = MachineLogic(transition_rules, transitions_dict=self.transitions_dict)
+            if engine != "dict":
+                if play_type != 0 or visualize:
+                    raise ValueError(f"Engine {engine!r} only supports headless auto play (play_type=0, visualize=False)")
+                transitions_dict = cpu.transitions_dict
+                if prune:
+                    transitions_dict = self.analyze(init_tape).pruned
+                if engine == "macro":
+                    from TuringMacro import MacroMachine
+                    runner = MacroMachine(transitions_dict, cpu.init_state, cpu.halt_state, cpu.blank_symbol)
+                elif engine == "codegen":
+                    from TuringCodegen import CodegenMachine
+                    runner = CodegenMachine(transitions_dict, cpu.init_state, cpu.halt_state, cpu.blank_symbol)
+                else:
+                    from TuringCompiler import CompiledMachine
+                    runner = CompiledMachine(transitions_dict, cpu.init_state, cpu.halt_state, cpu.blank_symbol)
+            stats.compile_s = time.perf_counter() - compile_start
+
+            stats.start()
+            if engine == "compiled":
+                final_tape, steps, rules_no = runner.run(init_tape, tape_type=tape_type or "dense", MAX_STEPS=MAX_STEPS)
+            elif engine != "dict":
+                final_tape, steps, rules_no = runner.run(init_tape, MAX_STEPS=MAX_STEPS)
+            elif play_type == 0:
+                final_tape, steps, rules_no = cpu.run_logic(
+                    init_tape, MAX_STEPS=MAX_STEPS, visualize=visualize,
+                    detect_loops=detect_loops, detect_translations=detect_translations,
+                    profile=machine_profile,
+                )
+            elif play_type == 1:
+                final_tape, steps, rules_no = cpu.run_step(init_tape, visualize=visualize, MAX_STEPS=MAX_STEPS)
+            stats.finish(steps, runner.tape_usage())
+        except (TuringConfig.MissingTransitionError, TuringConfig.TapeLimitError) as error:
+            if memo is not None:
+                memo.put(transition_rules, init_tape, MAX_STEPS, None, None, error)
+            raise
+        finally:
+            if tracing is not None:
+                stats.peak_alloc_bytes = stop_tracing(tracing)
+
+        resources_used = stats.report() + [
             f"Memory used: {TuringConfig.get_current_memory_mb()}MB"
         ]
+        if engine == "macro":
+            resources_used.append(f" Cache hits: {runner.cache_hit_rate:.2%}")
+        if prune:
+            resources_used.append(f"Rules used: {runner.rules_no} of {len(transition_rules)}")
 
         results = [
             f"Result Tape: '{final_tape}'",
             f"Steps Count: {steps}",
-            f"Total Rules: {rules_no}",
+            f"Total Rules: {len(transition_rules) if prune else rules_no}",
         ]
+        if machine_profile is not None:
+            results.extend(machine_profile.report())
+        if memo is not None:
+            memo.put(transition_rules, init_tape, MAX_STEPS, final_tape, steps)
 
         return transition_rules, results, resources_used
 
+    def _memoized_result(self, transition_rules, engine, memoized):
+        """run_machine's return value for an outcome found in the memo."""
+        from TuringStats import RunStats
+
+        final_tape, steps, error = memoized
+        if error is not None:
+            error_type, message = error
+            raise getattr(TuringConfig, error_type)(message)
+
+        stats = self.stats = RunStats(engine, self.parse_time)
+        stats.steps = steps
+        resources_used = stats.report() + [
+            f"Memory used: {TuringConfig.get_current_memory_mb()}MB",
+            "   Memoized: yes",
+        ]
+        results = [
+            f"Result Tape: '{final_tape}'",
+            f"Steps Count: {steps}",
+            f"Total Rules: {len(transition_rules)}",
+        ]
+        return transition_rules, results, resources_used
+
+    async def run_machine_async(
+        self,
+        init_tape,
+        *,
+        MAX_STEPS: int = 1_000_000,
+        chunk_size: int = 10_000,
+        executor=None,
+        resume: bool = False,
+    ):
+        """
+        Headless dict-engine run_machine for asyncio code (see TuringAsync.AsyncRun).
+
+        Runs chunk_size steps at a time and yields to the event loop between
+        chunks, optionally running each chunk on a thread executor. Works with
+        asyncio.wait_for and cancellation: the run is kept in self.async_run,
+        and resume=True continues it (e.g. with a larger MAX_STEPS) instead of
+        starting over. Returns the same (rules, results, resources) as run_machine.
+        """
+        from TuringAsync import AsyncRun
+        from TuringStats import RunStats
+
+        transition_rules = self.transition_rules.copy()
+        run = getattr(self, "async_run", None)
+        if not resume or run is None:
+            compile_start = time.perf_counter()
+            cpu = MachineLogic(transition_rules, transitions_dict=self.transitions_dict)
+            run = self.async_run = AsyncRun(cpu, init_tape, chunk_size=chunk_size, executor=executor)
+            compile_s = time.perf_counter() - compile_start
+        elif run.input_tape != init_tape:
+            raise ValueError("resume=True needs the input tape of the run being resumed")
+        else:
+            compile_s = 0.0
+
+        stats = self.stats = RunStats("dict", self.parse_time)
+        stats.compile_s = compile_s
+        steps_before = run.step_count
+        stats.start()
+        final_tape, steps, rules_no = await run.run(MAX_STEPS)
+        stats.finish(steps - steps_before, run.cpu.tape_usage())
+
+        results = [
+            f"Result Tape: '{final_tape}'",
+            f"Steps Count: {steps}",
+            f"Total Rules: {rules_no}",
+        ]
+        resources_used = stats.report() + [
+            f"Memory used: {TuringConfig.get_current_memory_mb()}MB"
+        ]
+        return transition_rules, results, resources_used
+
+    def run_checkpointed(
+        self,
+        init_tape,
+        checkpoint_path,
+        *,
+        MAX_STEPS: int = 1_000_000,
+        every_steps: int | None = None,
+        every_seconds: float | None = 60.0,
+    ):
+        """
+        Headless dict-engine run_machine that checkpoints to checkpoint_path (see TuringCheckpoint).
+
+        A checkpoint is written every every_steps steps and/or every_seconds
+        seconds, and once more when the run halts or reaches MAX_STEPS.
+        Returns the same (rules, results, resources) as run_machine.
+        """
+        from TuringCheckpoint import CheckpointRun
+
+        transition_rules = self.transition_rules.copy()
+        compile_start = time.perf_counter()
+        cpu = MachineLogic(transition_rules, transitions_dict=self.transitions_dict)
+        run = CheckpointRun(cpu, checkpoint_path, every_steps=every_steps, every_seconds=every_seconds)
+        run.start(init_tape)
+        return self._run_checkpoint(run, MAX_STEPS, time.perf_counter() - compile_start)
+
+    def resume_from(
+        self,
+        checkpoint,
+        *,
+        MAX_STEPS: int = 1_000_000,
+        every_steps: int | None = None,
+        every_seconds: float | None = 60.0,
+        checkpoint_path=None,
+    ):
+        """
+        Continue a run_checkpointed run from a checkpoint file (or a loaded Checkpoint).
+
+        MAX_STEPS is the overall budget counted from the original start, so
+        raising it continues a run that stopped at its old budget. New
+        checkpoints go to checkpoint_path, by default the file resumed from.
+        The rules must be the ones the checkpoint was taken with.
+        """
+        from TuringCheckpoint import Checkpoint, CheckpointRun
+
+        if not isinstance(checkpoint, Checkpoint):
+            checkpoint_path = checkpoint_path or checkpoint
+            checkpoint = Checkpoint.load(checkpoint)
+        elif checkpoint_path is None:
+            raise ValueError("checkpoint_path is required when resuming from a Checkpoint object")
+
+        transition_rules = self.transition_rules.copy()
+        compile_start = time.perf_counter()
+        cpu = MachineLogic(transition_rules, transitions_dict=self.transitions_dict)
+        run = CheckpointRun(cpu, checkpoint_path, every_steps=every_steps, every_seconds=every_seconds)
+        run.resume(checkpoint)
+        return self._run_checkpoint(run, MAX_STEPS, time.perf_counter() - compile_start)
+
+    def _run_checkpoint(self, run, MAX_STEPS, compile_s):
+        from TuringStats import RunStats
+
+        stats = self.stats = RunStats("dict", self.parse_time)
+        stats.compile_s = compile_s
+        steps_before = run.step_count
+        stats.start()
+        final_tape, steps, rules_no = run.run(MAX_STEPS)
+        stats.finish(steps - steps_before, run.cpu.tape_usage())
+
+        resources_used = stats.report() + [
+            f"Memory used: {TuringConfig.get_current_memory_mb()}MB",
+            f"Checkpoints: {run.checkpoints_written}",
+        ]
+        results = [
+            f"Result Tape: '{final_tape}'",
+            f"Steps Count: {steps}",
+            f"Total Rules: {rules_no}",
+        ]
+        return run.cpu.transitions_list, results, resources_used
+
+    def write_trace(self, init_tape, path, *, MAX_STEPS: int = 1_000_000, name: str = "") -> int:
+        """
+        Run headless and stream the step trace to path as StateManager.js JSON Lines (see TuringTrace).
+
+        The file opens in the web GUI, at step 0 with the whole run in its
+        history. Returns the step count.
+        """
+        from TuringTrace import write_jsonl_trace
+
+        cpu = MachineLogic(self.transition_rules.copy(), transitions_dict=self.transitions_dict)
+        return write_jsonl_trace(cpu, path, init_tape, rules_text=self.instructions, MAX_STEPS=MAX_STEPS, name=name)
+
+    def write_history(
+        self,
+        init_tape,
+        path,
+        *,
+        MAX_STEPS: int = 1_000_000,
+        keyframe_interval: int = 512,
+        compress: bool = True,
+        name: str = "",
+    ) -> int:
+        """
+        Run headless and stream the history to path in the v2 session format (see TuringSession).
+
+        Returns the step count. A stuck machine still gets a complete file up
+        to where it stopped before the MissingTransitionError propagates.
+        """
+        from TuringSession import HistoryWriter
+        from TuringTrace import trace_metadata
+
+        cpu = MachineLogic(self.transition_rules.copy(), transitions_dict=self.transitions_dict)
+        cpu.input_tape = init_tape
+        cpu._set_tape(init_tape)
+        step_count = 0
+        with HistoryWriter(
+            path, trace_metadata(cpu, self.instructions, name),
+            keyframe_interval=keyframe_interval, blank_symbol=cpu.blank_symbol, compress=compress,
+        ) as writer:
+            writer.reset(cpu.tape, cpu.head_position, cpu.current_state)
+            for event in cpu.iter_steps(MAX_STEPS=MAX_STEPS):
+                writer.record(
+                    event.head, event.read, event.write, event.state,
+                    cpu.tape, cpu.head_position, event.next_state,
+                )
+                step_count = event.step
+        return step_count
+
+    def run_batch(
+        self,
+        tapes,
+        workers: int | None = None,
+        *,
+        MAX_STEPS: int = 1_000_000,
+        chunksize: int | None = None,
+    ):
+        """
+        Run every input tape against these rules on a process pool.
+
+        The rules are compiled once and sent to each worker once. Yields
+        (input_tape, result_tape, steps, error) as each tape completes; error
+        is None, or the MissingTransitionError/max-steps message for that tape.
+        """
+        from TuringCompiler import CompiledMachine
+        from TuringBatch import run_batch
+
+        cpu = self._make_cpu()
+        compiled = CompiledMachine(cpu.transitions_dict, cpu.init_state, cpu.halt_state, cpu.blank_symbol)
+        return run_batch(compiled, tapes, workers, MAX_STEPS=MAX_STEPS, chunksize=chunksize)
+
+    def run_lockstep(self, tapes, *, MAX_STEPS: int = 1_000_000):
+        """
+        Run every input tape against these rules in NumPy lockstep (requires numpy).
+
+        Returns (input_tape, result_tape, steps, error) per tape in input order,
+        with the same error reporting as run_batch.
+        """
+        from TuringCompiler import CompiledMachine
+        from TuringLockstep import LockstepMachine
+
+        cpu = self._make_cpu()
+        compiled = CompiledMachine(cpu.transitions_dict, cpu.init_state, cpu.halt_state, cpu.blank_symbol)
+        return LockstepMachine(compiled).run(list(tapes), MAX_STEPS=MAX_STEPS)
+
 if __name__ == "__main__":
     init_rules = """
         INIT | FIND | R
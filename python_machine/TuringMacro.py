@@ -0,0 +1,192 @@
+"""
+Macro-machine (block symbol) Turing Machine engine.
+
+The tape is cut into fixed-size blocks and the machine advances one block at
+a time: a macro transition maps ``(state, block contents, entry offset)`` to
+the state, rewritten block, exit offset and number of steps taken until the
+head leaves the block (or the machine halts or gets stuck inside it). Macro
+transitions are simulated on first use and kept in a bounded LRU cache, so
+long repetitive runs collapse into a few dictionary lookups per block.
+
+Cached rows are premultiplied by the table width, so the cache is dropped
+whenever an input tape with new symbols widens the table.
+
+Cache hit rate = hits / (hits + misses), counted once per macro step; a
+cached transition that would overrun the remaining step budget is simulated
+cell by cell instead and counted as a miss.
+"""
+
+import sys
+from collections import OrderedDict
+
+from TuringMachine import TuringConfig
+from TuringCompiler import CompiledMachine
+
+MacroKey = tuple[int, bytes, int]
+# (row, block, exit offset, steps, lowest offset, highest offset)
+MacroResult = tuple[int, bytes, int, int, int, int]
+
+
+class MacroMachine:
+    """Block-symbol simulation over a CompiledMachine table."""
+
+    def __init__(
+        self,
+        transitions_dict: dict[str, dict[str, tuple[str, str, str]]],
+        init_state: str = "INIT",
+        halt_state: str = "HALT",
+        blank_symbol: str = TuringConfig.BLANK,
+        *,
+        block_size: int = 8,
+        cache_size: int = 2**16,
+    ) -> None:
+
+        if block_size < 1:
+            raise ValueError(f"Invalid block_size: {block_size}. Must be at least 1")
+
+        self.compiled = CompiledMachine(transitions_dict, init_state, halt_state, blank_symbol)
+        self.rules_no = self.compiled.rules_no
+        self.block_size = block_size
+        self.cache_size = cache_size
+        self.cache: OrderedDict[MacroKey, MacroResult] = OrderedDict()
+        # Keys and results hold rows premultiplied by this table width
+        self.cache_width = self.compiled.width
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+        self.blocks: dict[int, bytes] = {}
+        # Lowest and highest position the head reached, input cells included
+        self.tape_low = 0
+        self.tape_high = 0
+        self.head_position: int = 0
+        self.current_state: str = init_state
+
+    @property
+    def cache_hit_rate(self) -> float:
+        lookups = self.cache_hits + self.cache_misses
+        return self.cache_hits / lookups if lookups else 0.0
+
+    def _simulate_block(self, row: int, block: bytes, offset: int, limit: int) -> tuple[MacroResult, bool]:
+        """
+        Step inside one block until the head leaves it, the machine stops or ``limit`` steps.
+
+        Returns ``((row, block, offset, steps, low, high), complete)``; ``offset``
+        is -1 or ``block_size`` when the head left the block, and ``low``/``high``
+        are the lowest and highest offsets the head reached, exit included.
+        ``complete`` is False only when the step limit cut the simulation short,
+        so the result is not safe to cache.
+        """
+        table = self.compiled.table
+        block_size = self.block_size
+        cells = bytearray(block)
+        low = high = offset
+
+        steps = 0
+        while steps < limit:
+            entry = table[row + cells[offset]]
+            if entry is None:
+                return (row, bytes(cells), offset, steps, low, high), True
+            row, cells[offset], delta = entry
+            offset += delta
+            steps += 1
+            if offset < low:
+                low = offset
+            elif offset > high:
+                high = offset
+            if not 0 <= offset < block_size:
+                return (row, bytes(cells), offset, steps, low, high), True
+
+        return (row, bytes(cells), offset, steps, low, high), False
+
+    def run(
+        self,
+        input_tape: str,
+        *,
+        MAX_STEPS: int = 1_000_000,
+    ) -> tuple[str, int, int]:
+        """Run headless; same ``(tape, steps, rules_no)`` contract as ``MachineLogic.run_logic``."""
+        compiled = self.compiled
+        cells = compiled.encode_tape(input_tape)
+        if compiled.width > 256:
+            raise ValueError(f"Macro blocks hold at most 256 symbols, alphabet has {compiled.width}")
+        if compiled.width != self.cache_width:
+            # encode_tape widened the table for new input symbols, so every cached row is stale
+            self.cache.clear()
+            self.cache_width = compiled.width
+
+        block_size = self.block_size
+        blank_block = bytes(block_size)
+        blocks = self.blocks = {}
+        for start in range(0, len(cells), block_size):
+            block = bytes(cells[start:start + block_size]).ljust(block_size, b"\x00")
+            if block != blank_block:
+                blocks[start // block_size] = block
+
+        cache = self.cache
+        cache_size = self.cache_size
+        halt_row = compiled.state_ids[compiled.halt_state] * compiled.width
+        row = compiled.state_ids[compiled.init_state] * compiled.width
+        block_index, offset = 0, 0
+        tape_low, tape_high = 0, max(len(cells) - 1, 0)
+
+        step_count = 0
+        while step_count < MAX_STEPS:
+            block = blocks.get(block_index, blank_block)
+            key = (row, block, offset)
+            result = cache.get(key)
+            if result is not None and result[3] <= MAX_STEPS - step_count:
+                cache.move_to_end(key)
+                self.cache_hits += 1
+            else:
+                self.cache_misses += 1
+                result, complete = self._simulate_block(row, block, offset, MAX_STEPS - step_count)
+                if complete and result[3] <= MAX_STEPS - step_count:
+                    cache[key] = result
+                    if len(cache) > cache_size:
+                        cache.popitem(last=False)
+
+            row, block, offset, steps, low, high = result
+            start = block_index * block_size
+            if start + low < tape_low:
+                tape_low = start + low
+            if start + high > tape_high:
+                tape_high = start + high
+            if block == blank_block:
+                blocks.pop(block_index, None)
+            else:
+                blocks[block_index] = block
+            step_count += steps
+
+            if offset < 0:
+                block_index -= 1
+                offset = block_size - 1
+            elif offset >= block_size:
+                block_index += 1
+                offset = 0
+            else:
+                # Halted, stuck or out of budget inside the block
+                break
+
+        self.current_state = compiled.states[row // compiled.width]
+        self.head_position = block_index * block_size + offset
+        self.tape_low, self.tape_high = tape_low, tape_high
+        if step_count < MAX_STEPS and row != halt_row:
+            symbol_id = blocks.get(block_index, blank_block)[offset]
+            raise compiled._missing_transition(row, symbol_id, input_tape)
+
+        return self._render_tape(), step_count, self.rules_no
+
+    def tape_usage(self) -> tuple[int, int]:
+        """Cells spanned by the input and the head, as ``MachineLogic.tape_usage``, and bytes of the blocks."""
+        blocks = self.blocks
+        nbytes = sys.getsizeof(blocks) + sum(sys.getsizeof(block) for block in blocks.values())
+        return self.tape_high - self.tape_low + 1, nbytes
+
+    def _render_tape(self) -> str:
+        blocks = self.blocks
+        if not blocks:
+            return ""
+        blank_block = bytes(self.block_size)
+        used = b"".join([blocks.get(i, blank_block) for i in range(min(blocks), max(blocks) + 1)])
+        symbols = self.compiled.symbols
+        return "".join([symbols[symbol_id] for symbol_id in used.strip(b"\x00")])
@@ -0,0 +1,191 @@
+"""
+Memoized run results.
+
+``ResultMemo`` maps ``(rule set, input tape, step budget)`` to the outcome of
+a headless run: the result tape and step count, or the run-time error it
+ended in. The rule set is hashed in normalized form (sorted transitions, see
+``TuringCheckpoint.rules_digest``), so reordered or reformatted rule text
+still hits. The engine is not part of the key: every engine computes the
+same result tape, step count and MissingTransitionError. TapeLimitError is
+the exception, since only the dense tapes of the compiled, macro and codegen
+engines have a length limit, so it is never stored.
+
+The budget is part of the key, so a run cut short by ``MAX_STEPS`` is only
+reused for that same budget. A run that halted with fewer steps than its
+budget is stored under a budget-free key instead, so it answers any budget
+at least as large as its step count.
+
+Entries live in an in-memory LRU of ``max_entries`` and, with ``db_path``,
+in a SQLite table that is trimmed back to its ``max_db_entries`` most
+recently used rows every few writes and on ``close``.
+"""
+
+import hashlib
+import os
+import time
+from collections import OrderedDict
+
+from TuringCheckpoint import rules_digest
+from TuringMachine import TuringConfig
+
+MEMO_VERSION = 1
+
+# (result tape, steps, error); error is None or (TuringConfig exception name, message)
+MemoEntry = tuple[str | None, int | None, tuple[str, str] | None]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    key TEXT PRIMARY KEY,
+    tape TEXT,
+    steps INTEGER,
+    error_type TEXT,
+    error_message TEXT,
+    used REAL NOT NULL
+)
+"""
+_USED_INDEX = "CREATE INDEX IF NOT EXISTS results_used ON results (used)"
+
+# Database writes between trims back down to max_db_entries
+_TRIM_EVERY = 64
+
+
+class ResultMemo:
+    """In-memory LRU of run outcomes, optionally backed by a SQLite database."""
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        db_path: str | os.PathLike | None = None,
+        max_db_entries: int = 100_000,
+    ) -> None:
+        if max_entries < 1:
+            raise ValueError(f"Invalid max_entries: {max_entries}. Must be at least 1")
+        if max_db_entries < 1:
+            raise ValueError(f"Invalid max_db_entries: {max_db_entries}. Must be at least 1")
+        self.max_entries = max_entries
+        self.max_db_entries = max_db_entries
+        self.entries: OrderedDict[str, MemoEntry] = OrderedDict()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+        self.db = None
+        self.db_writes = 0
+        if db_path is not None:
+            import sqlite3
+
+            self.db = sqlite3.connect(db_path)
+            with self.db:
+                self.db.execute(_SCHEMA)
+                self.db.execute(_USED_INDEX)
+
+    @staticmethod
+    def key(transitions_list: list[tuple[str, str, str, str, str]], input_tape: str, MAX_STEPS: int | None) -> str:
+        """Hash of the normalized rule set, the input tape and the budget (None for halted runs)."""
+        digest = hashlib.sha256()
+        digest.update(repr((MEMO_VERSION, TuringConfig.BLANK, "INIT", "HALT", MAX_STEPS)).encode())
+        digest.update(rules_digest(transitions_list))
+        digest.update(input_tape.encode())
+        return digest.hexdigest()
+
+    def get(self, transitions_list: list, input_tape: str, MAX_STEPS: int) -> MemoEntry | None:
+        entry, on_disk = self._lookup(self.key(transitions_list, input_tape, MAX_STEPS))
+        if entry is None:
+            entry, on_disk = self._lookup(self.key(transitions_list, input_tape, None))
+            if entry is not None and entry[1] > MAX_STEPS:
+                entry = None
+        if entry is None:
+            self.misses += 1
+        elif on_disk:
+            self.disk_hits += 1
+        else:
+            self.hits += 1
+        return entry
+
+    def put(
+        self,
+        transitions_list: list,
+        input_tape: str,
+        MAX_STEPS: int,
+        result_tape: str | None,
+        steps: int | None,
+        error: Exception | None = None,
+    ) -> None:
+        """Store one outcome; ``error`` is the TuringConfig run-time exception the run raised, if any."""
+        if isinstance(error, TuringConfig.TapeLimitError):
+            # Engine-dependent: the dict engine and sparse tapes would run on
+            return
+        halted = error is None and steps < MAX_STEPS
+        key = self.key(transitions_list, input_tape, None if halted else MAX_STEPS)
+        entry = (result_tape, steps, None if error is None else (type(error).__name__, str(error)))
+        self._remember(key, entry)
+        if self.db is not None:
+            self._store(key, entry)
+
+    def _lookup(self, key: str) -> tuple[MemoEntry | None, bool]:
+        """The entry under ``key`` and whether it came from the database."""
+        entry = self.entries.get(key)
+        if entry is not None:
+            self.entries.move_to_end(key)
+            return entry, False
+
+        if self.db is not None:
+            entry = self._load(key)
+            if entry is not None:
+                self._remember(key, entry)
+                return entry, True
+        return None, False
+
+    def _remember(self, key: str, entry: MemoEntry) -> None:
+        self.entries[key] = entry
+        self.entries.move_to_end(key)
+        if len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+
+    def _load(self, key: str) -> MemoEntry | None:
+        with self.db:
+            row = self.db.execute(
+                "SELECT tape, steps, error_type, error_message FROM results WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            self.db.execute("UPDATE results SET used = ? WHERE key = ?", (time.time(), key))
+        tape, steps, error_type, error_message = row
+        return tape, steps, None if error_type is None else (error_type, error_message)
+
+    def _store(self, key: str, entry: MemoEntry) -> None:
+        tape, steps, error = entry
+        error_type, error_message = error or (None, None)
+        with self.db:
+            self.db.execute(
+                "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?, ?)",
+                (key, tape, steps, error_type, error_message, time.time()),
+            )
+            self.db_writes += 1
+            if self.db_writes % _TRIM_EVERY == 0:
+                self._trim()
+
+    def _trim(self) -> None:
+        """Evict the least recently used rows past ``max_db_entries``."""
+        self.db.execute(
+            "DELETE FROM results WHERE key IN ("
+            "SELECT key FROM results ORDER BY used DESC LIMIT -1 OFFSET ?)",
+            (self.max_db_entries,),
+        )
+
+    def clear(self, *, disk: bool = True) -> None:
+        """Drop every in-memory entry, and with ``disk`` every database row."""
+        self.entries.clear()
+        if disk and self.db is not None:
+            with self.db:
+                self.db.execute("DELETE FROM results")
+
+    def close(self) -> None:
+        if self.db is not None:
+            with self.db:
+                self._trim()
+            self.db.close()
+            self.db = None
+
+    def __len__(self) -> int:
+        return len(self.entries)
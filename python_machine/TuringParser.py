@@ -0,0 +1,184 @@
+"""
+Single-pass parser for transition rule text.
+
+``parse_rules`` walks the text once, line by line, without splitting it up
+front. Each line is tokenized, validated and inserted into the nested
+``transitions_dict`` lookup table right away. Errors do not stop the pass:
+each one is recorded as a ``RuleError`` with its line and column, and the
+caller raises them together (``ParsedRules.raise_for_errors``) using its own
+exception types. Whole-rule-set checks (initial state, halt state, state
+count) run once the pass is done.
+
+This module has no imports from the rest of the package, so ``TuringMachine``
+and the tools built on it can use it without import cycles.
+"""
+
+import re
+from typing import NamedTuple
+
+TransitionsDict = dict[str, dict[str, tuple[str, str, str]]]
+
+_TOKEN = re.compile(r"\S+")
+
+
+class RuleError(NamedTuple):
+    """One problem in the rule text; ``line`` and ``column`` are 1-based, 0 for rule-set-wide errors."""
+
+    kind: str  # "transition", "symbol" or "state"
+    message: str
+    line: int
+    column: int
+
+    def __str__(self) -> str:
+        if not self.line:
+            return self.message
+        return f"line {self.line}, col {self.column}: {self.message}"
+
+
+class ParsedRules:
+    """Result of one parse: the rule list, its lookup table and every error found."""
+
+    __slots__ = ("transitions", "transitions_dict", "errors")
+
+    def __init__(self, transitions: list[tuple[str, str, str, str, str]], transitions_dict: TransitionsDict, errors: list[RuleError]) -> None:
+        self.transitions = transitions
+        self.transitions_dict = transitions_dict
+        self.errors = errors
+
+    def raise_for_errors(self, exception_types: dict[str, type[Exception]]) -> None:
+        """
+        Raise all errors at once as the type mapped from the first error's kind.
+
+        The exception message lists every error and the exception carries
+        them as ``.errors``.
+        """
+        if not self.errors:
+            return
+        first = self.errors[0]
+        if len(self.errors) == 1:
+            message = str(first)
+        else:
+            message = f"{len(self.errors)} errors in transition rules:\n" + "\n".join(map(str, self.errors))
+        error = exception_types[first.kind](message)
+        error.errors = self.errors
+        raise error
+
+
+def _column(line: str, token_index: int) -> int:
+    """1-based column of the ``token_index``-th token on ``line`` (only computed for errors)."""
+    for i, match in enumerate(_TOKEN.finditer(line)):
+        if i == token_index:
+            return match.start() + 1
+    return 1
+
+
+def parse_rules(
+    text: str,
+    *,
+    init_state: str = "INIT",
+    halt_state: str = "HALT",
+    left: str = "L",
+    right: str = "R",
+    comment_prefix: str = "//",
+    max_states: int | None = None,
+    max_state_size: int | None = None,
+    check_machine: bool = True,
+) -> ParsedRules:
+    """
+    Tokenize, validate and index ``text`` in one pass.
+
+    Each non-empty line (after removing ``comment_prefix`` comments) must be
+    ``currentState currentSymbol newState newSymbol moveDirection``, separated
+    by whitespace. With ``check_machine`` the rule set must also define
+    ``init_state``, target ``halt_state`` and stay within ``max_states``
+    (checked only when every line parsed cleanly).
+    """
+    transitions: list[tuple[str, str, str, str, str]] = []
+    transitions_dict: TransitionsDict = {}
+    defined_on: dict[tuple[str, str], int] = {}
+    errors: list[RuleError] = []
+    directions = (left, right)
+    has_halt_state = False
+
+    pos = 0
+    line_no = 0
+    length = len(text)
+    while pos <= length:
+        end = text.find("\n", pos)
+        if end < 0:
+            end = length
+        line = text[pos:end]
+        pos = end + 1
+        line_no += 1
+
+        cut = line.find(comment_prefix)
+        if cut >= 0:
+            line = line[:cut]
+        values = line.split()
+        if not values:
+            continue
+
+        if len(values) != 5:
+            errors.append(RuleError(
+                "transition",
+                f"Invalid transition: {values}. Expected 5 elements got {len(values)}",
+                line_no, _column(line, 5 if len(values) > 5 else 0),
+            ))
+            continue
+
+        current_state, current_symbol, new_state, new_symbol, direction = values
+        valid = True
+        if direction not in directions:
+            errors.append(RuleError(
+                "transition", f"Invalid moveDirection: {direction}. Must be {left} or {right}",
+                line_no, _column(line, 4),
+            ))
+            valid = False
+        for symbol, label, index in ((current_symbol, "current", 1), (new_symbol, "new", 3)):
+            if len(symbol) != 1:
+                errors.append(RuleError(
+                    "symbol", f"Invalid {label}_symbol: {symbol!r}. Must be a single character.",
+                    line_no, _column(line, index),
+                ))
+                valid = False
+        if max_state_size is not None:
+            for state, label, index in ((current_state, "current", 0), (new_state, "new", 2)):
+                if len(state) > max_state_size:
+                    errors.append(RuleError(
+                        "state",
+                        f"Invalid {label}_state: {state} size={len(state)}. "
+                        f"State Size must be less than {max_state_size} characters.",
+                        line_no, _column(line, index),
+                    ))
+                    valid = False
+        if not valid:
+            continue
+
+        state_transitions = transitions_dict.get(current_state)
+        if state_transitions is None:
+            state_transitions = transitions_dict[current_state] = {}
+        if current_symbol in state_transitions:
+            errors.append(RuleError(
+                "transition",
+                f"Duplicate transition for state {current_state} and symbol {current_symbol} "
+                f"(first defined on line {defined_on[current_state, current_symbol]})",
+                line_no, _column(line, 0),
+            ))
+            continue
+
+        state_transitions[current_symbol] = (new_state, new_symbol, direction)
+        defined_on[current_state, current_symbol] = line_no
+        transitions.append((current_state, current_symbol, new_state, new_symbol, direction))
+        if new_state == halt_state:
+            has_halt_state = True
+
+    # Rule-set checks are skipped after line errors, which would only cascade into them
+    if check_machine and not errors:
+        if max_states is not None and len(transitions_dict) > max_states:
+            errors.append(RuleError("transition", f"Too many states: {len(transitions_dict)}. Maximum is {max_states}.", 0, 0))
+        if init_state not in transitions_dict:
+            errors.append(RuleError("transition", f"Initial state {init_state} not found in the transitions", 0, 0))
+        if not has_halt_state:
+            errors.append(RuleError("transition", f"Halt state {halt_state} not found in the transitions", 0, 0))
+
+    return ParsedRules(transitions, transitions_dict, errors)
@@ -0,0 +1,148 @@
+"""
+Opt-in instrumentation for the dict-based interpreters.
+
+``MachineProfile.run`` is a separate copy of the headless step loop that
+also counts executions per (state, symbol) transition, head direction
+reversals, tape growth events (the head reaching a cell beyond every cell
+visited so far) and wall time spent in each state. ``MachineLogic`` and
+``LogicMill`` only switch to it when a profile is passed in, so their
+normal loops carry no instrumentation cost at all.
+
+Time per state is charged whenever the state changes, so it costs one
+clock read per state change rather than one per step.
+"""
+
+import json
+import time
+
+TransitionsDict = dict[str, dict[str, tuple[str, str, str]]]
+
+
+class MachineProfile:
+    """Counters collected over one or more profiled runs."""
+
+    def __init__(self) -> None:
+        self.transitions: TransitionsDict = {}
+        self.hits: dict[tuple[str, str], int] = {}
+        self.steps = 0
+        self.reversals = 0
+        self.growth_events = 0
+        self.state_time: dict[str, float] = {}
+
+    def run(
+        self,
+        transitions: TransitionsDict,
+        tape: dict[int, str],
+        blank: str,
+        halt_state: str,
+        state: str,
+        head: int,
+        low: int,
+        high: int,
+        MAX_STEPS: int,
+    ) -> tuple[str, int, int, int, int, bool]:
+        """
+        Step until halt, a missing transition or MAX_STEPS, counting as it goes.
+
+        ``low``/``high`` are the tape bounds visited so far. Returns
+        ``(state, head, low, high, steps, stuck)``; ``stuck`` is True when the
+        machine stopped on a missing transition, which the caller reports with
+        its own error type.
+        """
+        self.transitions = transitions
+        hits = self.hits
+        state_time = self.state_time
+        shifts = {"L": -1, "R": +1}
+        reversals = growth_events = 0
+        last_move = None
+
+        clock = time.perf_counter
+        entered = clock()
+        step_count = 0
+        stuck = False
+        try:
+            while step_count < MAX_STEPS:
+                if state == halt_state:
+                    break
+
+                current_symbol = tape.get(head, blank)
+                transition = transitions.get(state, {}).get(current_symbol)
+                if not transition:
+                    stuck = True
+                    break
+
+                key = (state, current_symbol)
+                hits[key] = hits.get(key, 0) + 1
+
+                new_state, new_symbol, move_direction = transition
+                if new_symbol == blank:
+                    tape.pop(head, None)
+                else:
+                    tape[head] = new_symbol
+
+                if move_direction != last_move:
+                    if last_move is not None:
+                        reversals += 1
+                    last_move = move_direction
+
+                head += shifts[move_direction]
+                if head < low:
+                    low = head
+                    growth_events += 1
+                elif head > high:
+                    high = head
+                    growth_events += 1
+
+                if new_state != state:
+                    now = clock()
+                    state_time[state] = state_time.get(state, 0.0) + now - entered
+                    entered = now
+                    state = new_state
+                step_count += 1
+        finally:
+            if state != halt_state:
+                state_time[state] = state_time.get(state, 0.0) + clock() - entered
+            self.steps += step_count
+            self.reversals += reversals
+            self.growth_events += growth_events
+
+        return state, head, low, high, step_count, stuck
+
+    def hot_transitions(self) -> list[tuple[str, int, float]]:
+        """``(rule, hits, share of steps)`` per executed transition, most executed first."""
+        ranked = []
+        for (state, symbol), count in sorted(self.hits.items(), key=lambda item: item[1], reverse=True):
+            new_state, new_symbol, move_direction = self.transitions[state][symbol]
+            rule = f"{state} {symbol} {new_state} {new_symbol} {move_direction}"
+            ranked.append((rule, count, count / self.steps if self.steps else 0.0))
+        return ranked
+
+    def report(self, top: int | None = 10) -> list[str]:
+        """Sorted, printable summary; ``top=None`` lists every executed transition."""
+        lines = [
+            f"Profiled Steps: {self.steps}",
+            f"Dir Reversals: {self.reversals}",
+            f"Tape Growth: {self.growth_events}",
+            "Hot Transitions:",
+        ]
+        for rule, count, share in self.hot_transitions()[:top]:
+            lines.append(f"  {share:7.2%} {count:>10}  {rule}")
+        lines.append("Time per State:")
+        for state, seconds in sorted(self.state_time.items(), key=lambda item: item[1], reverse=True)[:top]:
+            lines.append(f"  {seconds:9.5f}s  {state}")
+        return lines
+
+    def to_dict(self) -> dict:
+        return {
+            "steps": self.steps,
+            "reversals": self.reversals,
+            "growth_events": self.growth_events,
+            "transitions": [
+                {"rule": rule, "hits": count, "share": share}
+                for rule, count, share in self.hot_transitions()
+            ],
+            "state_time": dict(sorted(self.state_time.items(), key=lambda item: item[1], reverse=True)),
+        }
+
+    def to_json(self, indent: int | None = 2) -> str:
+        return json.dumps(self.to_dict(), indent=indent)
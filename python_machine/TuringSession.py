@@ -0,0 +1,327 @@
+"""
+Saved machine sessions: the v2 delta-encoded history file, and v1 JSON import.
+
+The v1 session files (``example_files/*.json``, written by the web GUI) store
+a full tape dict in every history entry, so they grow quadratically with the
+run and have to be parsed whole. The v2 format stores the history the way
+``TuringHistory.StepHistory`` keeps it in memory: a keyframe every
+``keyframe_interval`` steps plus one write delta per step.
+
+Layout (little-endian)::
+
+    header   b"TMH2" | version u8 | flags u8 | keyframe_interval u32 |
+             metadata length u32 | trailer offset u64 | trailer length u32
+    metadata JSON: the v1 session fields without ``history``
+    blocks   one per keyframe, optionally zlib-compressed (flags bit 0)
+    trailer  JSON: block offsets, state and symbol tables, step count, final head/state
+
+Block ``b`` is a JSON array ``[head, state, cells, deltas]``: the keyframe at
+step ``b * keyframe_interval`` (``cells`` a flat ``position, symbol`` list)
+and the deltas of the steps that follow it (flat ``head, old symbol, new
+symbol, state`` quadruples). States and symbols are ids into the trailer
+tables. ``HistoryFile`` maps the file and decodes only the one block that
+holds the requested step, so seeking costs the same at any point of the run.
+"""
+
+import json
+import mmap
+import os
+import struct
+import zlib
+from pathlib import Path
+
+from TuringMachine import TuringConfig
+from TuringHistory import Keyframe, StepHistory
+
+SESSION_VERSION = 2
+_MAGIC = b"TMH2"
+_HEADER = struct.Struct("<4sBBIIQI")
+_COMPRESSED = 0x01
+
+
+class HistoryWriter:
+    """
+    Streams a step history into a v2 file; ``reset`` and ``record`` match ``StepHistory``.
+
+    Only the block being filled is held in memory, so headless runs of any
+    length can be saved. Use as a context manager, or call ``close``.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike,
+        metadata: dict | None = None,
+        *,
+        keyframe_interval: int = 512,
+        blank_symbol: str = TuringConfig.BLANK,
+        compress: bool = True,
+    ) -> None:
+        if keyframe_interval < 1:
+            raise ValueError(f"Invalid keyframe_interval: {keyframe_interval}. Must be at least 1")
+        self.keyframe_interval = keyframe_interval
+        self.blank_symbol = blank_symbol
+        self.compress = compress
+        self.step_count = 0
+        self.offsets: list[int] = []
+        self.states: dict[str, int] = {}
+        self.symbols: dict[str, int] = {blank_symbol: 0}
+        self.block: list | None = None
+        self.head = 0
+        self.state = ""
+
+        meta = {key: value for key, value in (metadata or {}).items() if key != "history"}
+        meta.setdefault("BLANK", blank_symbol)
+        self._meta = json.dumps(meta, ensure_ascii=False).encode()
+        self.file = open(path, "wb")
+        self.file.write(_HEADER.pack(_MAGIC, SESSION_VERSION, 0, 0, 0, 0, 0))
+        self.file.write(self._meta)
+
+    def _state_id(self, state: str) -> int:
+        state_id = self.states.get(state)
+        if state_id is None:
+            state_id = self.states[state] = len(self.states)
+        return state_id
+
+    def _symbol_id(self, symbol: str) -> int:
+        symbol_id = self.symbols.get(symbol)
+        if symbol_id is None:
+            symbol_id = self.symbols[symbol] = len(self.symbols)
+        return symbol_id
+
+    def _start_block(self, tape: dict[int, str], head: int, state: str) -> None:
+        cells = []
+        for position, symbol in sorted(tape.items()):
+            cells += (position, self._symbol_id(symbol))
+        self.block = [head, self._state_id(state), cells, []]
+
+    def _flush_block(self) -> None:
+        payload = json.dumps(self.block, separators=(",", ":")).encode()
+        if self.compress:
+            payload = zlib.compress(payload)
+        self.offsets.append(self.file.tell())
+        self.file.write(payload)
+        self.block = None
+
+    def reset(self, tape: dict[int, str], head: int, state: str) -> None:
+        """Start the history from the configuration at step 0."""
+        if self.step_count or self.offsets or self.block is not None:
+            raise ValueError("HistoryWriter can only be reset before the first step")
+        self._start_block(tape, head, state)
+        self.head, self.state = head, state
+
+    def record(
+        self,
+        old_head: int,
+        old_symbol: str,
+        new_symbol: str,
+        old_state: str,
+        tape: dict[int, str],
+        head: int,
+        state: str,
+    ) -> None:
+        """Append one step; ``tape``/``head``/``state`` are the configuration after it."""
+        if self.block is None:
+            raise ValueError("HistoryWriter.reset must be called before record")
+        self.block[3] += (old_head, self._symbol_id(old_symbol), self._symbol_id(new_symbol), self._state_id(old_state))
+        self.step_count += 1
+        self.head, self.state = head, state
+        if self.step_count % self.keyframe_interval == 0:
+            self._flush_block()
+            self._start_block(tape, head, state)
+
+    def close(self) -> None:
+        if self.file.closed:
+            return
+        if self.block is not None:
+            self._flush_block()
+        trailer = json.dumps({
+            "offsets": self.offsets,
+            "states": list(self.states),
+            "symbols": list(self.symbols),
+            "step_count": self.step_count,
+            "head": self.head,
+            "state": self.state,
+        }, ensure_ascii=False).encode()
+        trailer_offset = self.file.tell()
+        self.file.write(trailer)
+        self.file.seek(0)
+        self.file.write(_HEADER.pack(
+            _MAGIC, SESSION_VERSION, _COMPRESSED if self.compress else 0,
+            self.keyframe_interval, len(self._meta), trailer_offset, len(trailer),
+        ))
+        self.file.close()
+
+    def __enter__(self) -> "HistoryWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class HistoryFile:
+    """Memory-mapped v2 history file; ``config_at(step)`` decodes a single block."""
+
+    def __init__(self, path: str | os.PathLike) -> None:
+        with open(path, "rb") as session_file:
+            self.map = mmap.mmap(session_file.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            (magic, version, flags, self.keyframe_interval,
+             meta_length, trailer_offset, trailer_length) = _HEADER.unpack_from(self.map)
+            if magic != _MAGIC:
+                raise ValueError(f"{path} is not a v2 session file")
+            if version != SESSION_VERSION:
+                raise ValueError(f"Unsupported session version {version}. Expected {SESSION_VERSION}")
+            if not trailer_offset:
+                raise ValueError(f"{path} was not closed properly (no block index)")
+            self.compressed = bool(flags & _COMPRESSED)
+            self.metadata = json.loads(self.map[_HEADER.size:_HEADER.size + meta_length])
+            trailer = json.loads(self.map[trailer_offset:trailer_offset + trailer_length])
+        except (struct.error, ValueError):
+            self.map.close()
+            raise
+        self.offsets: list[int] = trailer["offsets"]
+        self.ends = self.offsets[1:] + [trailer_offset]
+        self.states: list[str] = trailer["states"]
+        self.symbols: list[str] = trailer["symbols"]
+        self.step_count: int = trailer["step_count"]
+        self.head: int = trailer["head"]
+        self.state: str = trailer["state"]
+        self.blank_symbol: str = self.metadata.get("BLANK", TuringConfig.BLANK)
+
+    def __len__(self) -> int:
+        """Number of recorded configurations: steps 0 .. step_count."""
+        return self.step_count + 1
+
+    def _block(self, index: int) -> list:
+        payload = self.map[self.offsets[index]:self.ends[index]]
+        if self.compressed:
+            payload = zlib.decompress(payload)
+        return json.loads(payload)
+
+    def config_at(self, step: int) -> Keyframe:
+        """Return ``(tape, head, state)`` at ``step``."""
+        if not 0 <= step <= self.step_count:
+            raise IndexError(f"Step {step} out of range 0..{self.step_count}")
+        index, replay = divmod(step, self.keyframe_interval)
+        head, state_id, cells, deltas = self._block(index)
+
+        symbols, blank = self.symbols, self.blank_symbol
+        tape = {cells[i]: symbols[cells[i + 1]] for i in range(0, len(cells), 2)}
+        for i in range(0, 4 * replay, 4):
+            new_symbol = symbols[deltas[i + 2]]
+            if new_symbol == blank:
+                tape.pop(deltas[i], None)
+            else:
+                tape[deltas[i]] = new_symbol
+
+        if not replay:
+            return tape, head, self.states[state_id]
+        if 4 * replay < len(deltas):
+            return tape, deltas[4 * replay], self.states[deltas[4 * replay + 3]]
+        return tape, self.head, self.state
+
+    def to_step_history(self) -> StepHistory:
+        """Load the whole history into a ``StepHistory``."""
+        history = StepHistory(self.keyframe_interval, self.blank_symbol)
+        symbols, states = self.symbols, self.states
+        for index in range(len(self.offsets)):
+            head, state_id, cells, deltas = self._block(index)
+            tape = {cells[i]: symbols[cells[i + 1]] for i in range(0, len(cells), 2)}
+            history.keyframes.append((tape, head, states[state_id]))
+            history.deltas += [
+                (deltas[i], symbols[deltas[i + 1]], symbols[deltas[i + 2]], states[deltas[i + 3]])
+                for i in range(0, len(deltas), 4)
+            ]
+        history.head, history.state = self.head, self.state
+        return history
+
+    def close(self) -> None:
+        self.map.close()
+
+    def __enter__(self) -> "HistoryFile":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def save_history(
+    path: str | os.PathLike,
+    history: StepHistory,
+    metadata: dict | None = None,
+    *,
+    compress: bool = True,
+) -> None:
+    """Write an in-memory ``StepHistory`` as a v2 file, keeping its keyframe interval."""
+    with HistoryWriter(
+        path, metadata, keyframe_interval=history.keyframe_interval,
+        blank_symbol=history.blank_symbol, compress=compress,
+    ) as writer:
+        tape, head, state = history.keyframes[0]
+        writer.reset(tape, head, state)
+        tape = tape.copy()
+        blank = history.blank_symbol
+        for step, (old_head, old_symbol, new_symbol, old_state) in enumerate(history.deltas, 1):
+            if new_symbol == blank:
+                tape.pop(old_head, None)
+            else:
+                tape[old_head] = new_symbol
+            head = history.head_at(step)
+            writer.record(old_head, old_symbol, new_symbol, old_state, tape, head, history.state_at(step))
+
+
+def read_v1(path: str | os.PathLike, keyframe_interval: int = 512) -> tuple[dict, StepHistory]:
+    """
+    Read a v1 JSON session into its metadata and a ``StepHistory``.
+
+    The per-step deltas are recovered by comparing the cell under the head
+    of each entry with the next entry's tape.
+    """
+    session = json.loads(Path(path).read_text(encoding="utf-8"))
+    entries = session.pop("history", None) or []
+    blank = session.get("BLANK") or TuringConfig.BLANK
+    history = StepHistory(keyframe_interval, blank)
+    if not entries:
+        return session, history
+
+    def tape_of(entry: dict) -> dict[int, str]:
+        cells = entry["tape"]
+        # The web GUI's empty default tape is an array
+        items = cells.items() if isinstance(cells, dict) else enumerate(cells)
+        return {int(position): symbol for position, symbol in items if symbol != blank}
+
+    tape = tape_of(entries[0])
+    history.reset(tape, entries[0]["head"], entries[0]["state"])
+    for entry, next_entry in zip(entries, entries[1:]):
+        next_tape = tape_of(next_entry)
+        head = entry["head"]
+        history.record(
+            head, tape.get(head, blank), next_tape.get(head, blank), entry["state"],
+            next_tape, next_entry["head"], next_entry["state"],
+        )
+        tape = next_tape
+    return session, history
+
+
+def convert_v1(
+    source: str | os.PathLike,
+    target: str | os.PathLike,
+    *,
+    keyframe_interval: int = 512,
+    compress: bool = True,
+) -> None:
+    """Convert a v1 JSON session file to the v2 format."""
+    metadata, history = read_v1(source, keyframe_interval)
+    if not history.keyframes:
+        raise ValueError(f"{source} has no history to convert")
+    save_history(target, history, metadata, compress=compress)
+
+
+def load_session(path: str | os.PathLike) -> tuple[dict, StepHistory]:
+    """Metadata and full ``StepHistory`` of a session file in either format."""
+    with open(path, "rb") as session_file:
+        magic = session_file.read(len(_MAGIC))
+    if magic == _MAGIC:
+        with HistoryFile(path) as history_file:
+            return history_file.metadata, history_file.to_step_history()
+    return read_v1(path)
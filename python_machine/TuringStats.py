@@ -0,0 +1,91 @@
+"""
+Per-run resource accounting.
+
+``RunStats`` splits a ``run_machine`` call into its phases: parsing (done when
+the ``TuringMachine`` was built), compiling the engine, and executing it.
+Execution is measured both as wall time (``perf_counter``) and as process CPU
+time (``process_time``). The record also holds the tape cells the engine
+spanned, the memory its tape storage takes and, when asked for, the peak
+Python allocation during compile and execution, as traced by tracemalloc.
+"""
+
+import time
+import tracemalloc
+
+
+class RunStats:
+    """Timings and memory figures of one run."""
+
+    __slots__ = (
+        "engine", "parse_s", "compile_s", "exec_s", "cpu_s",
+        "steps", "tape_cells", "tape_bytes", "peak_alloc_bytes",
+        "_wall_start", "_cpu_start",
+    )
+
+    def __init__(self, engine: str, parse_s: float = 0.0) -> None:
+        self.engine = engine
+        self.parse_s = parse_s
+        self.compile_s = 0.0
+        self.exec_s = 0.0
+        self.cpu_s = 0.0
+        self.steps = 0
+        self.tape_cells = 0
+        self.tape_bytes = 0
+        self.peak_alloc_bytes: int | None = None
+
+    @property
+    def steps_per_s(self) -> float:
+        return self.steps / self.exec_s if self.exec_s else 0.0
+
+    def start(self) -> None:
+        """Mark the start of execution."""
+        self._wall_start = time.perf_counter()
+        self._cpu_start = time.process_time()
+
+    def finish(self, steps: int, tape_usage: tuple[int, int]) -> None:
+        """Mark the end of execution; ``tape_usage`` is the engine's ``(cells, bytes)``."""
+        self.exec_s = time.perf_counter() - self._wall_start
+        self.cpu_s = time.process_time() - self._cpu_start
+        self.steps = steps
+        self.tape_cells, self.tape_bytes = tape_usage
+
+    def report(self) -> list[str]:
+        lines = [
+            f"   Time run: {self.exec_s:.5f}s",
+            f"   CPU time: {self.cpu_s:.5f}s",
+            f" Parse time: {self.parse_s:.5f}s",
+            f"Compile time: {self.compile_s:.5f}s",
+            f"  Steps/sec: {self.steps_per_s:,.0f}",
+            f" Tape cells: {self.tape_cells} ({self.tape_bytes / 1024:.1f}KB)",
+        ]
+        if self.peak_alloc_bytes is not None:
+            lines.append(f" Peak alloc: {self.peak_alloc_bytes / (1024 * 1024):.2f}MB")
+        return lines
+
+    def to_dict(self) -> dict:
+        stats = {name: getattr(self, name) for name in self.__slots__ if not name.startswith("_")}
+        stats["steps_per_s"] = self.steps_per_s
+        return stats
+
+
+def start_tracing() -> tuple[bool, int]:
+    """
+    Start tracemalloc, or reset its peak if already running.
+
+    Returns whether it was started here and the bytes already traced, which
+    ``stop_tracing`` subtracts so the peak only counts what was allocated since.
+    """
+    if tracemalloc.is_tracing():
+        tracemalloc.reset_peak()
+        return False, tracemalloc.get_traced_memory()[0]
+    tracemalloc.start()
+    return True, 0
+
+
+def stop_tracing(tracing: tuple[bool, int]) -> int:
+    """Peak traced bytes since ``start_tracing``; stops tracemalloc if it was started there."""
+    started, baseline = tracing
+    peak = tracemalloc.get_traced_memory()[1] - baseline
+    if started:
+        tracemalloc.stop()
+    return peak
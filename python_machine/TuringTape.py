@@ -0,0 +1,129 @@
+"""
+Tape storage for the compiled engines.
+
+Both tapes hold symbol ids as produced by ``CompiledMachine`` (blank is id 0):
+- ``DenseTape``:  a ``bytearray`` that grows in both directions around an
+  origin offset; one byte per cell and a single slice/decode at halt.
+- ``SparseTape``: a ``dict[int, int]`` holding only non-blank cells, for
+  machines that touch a few cells spread far apart.
+"""
+
+import sys
+
+from TuringMachine import TuringConfig
+
+
+class DenseTape:
+    """Bidirectional bytearray tape; ``buf[origin]`` is tape position 0."""
+
+    MIN_SIZE = 64
+
+    def __init__(
+        self,
+        cells: list[int],
+        max_len: int = TuringConfig.MAX_TAPE_LEN,
+    ) -> None:
+        self.max_len = max_len
+        if len(cells) > max_len:
+            raise TuringConfig.TapeLimitError(
+                f"Input tape length {len(cells)} exceeds MAX_TAPE_LEN {max_len}"
+            )
+
+        # Leave headroom on both sides so short sweeps never trigger a resize
+        margin = min(max(len(cells), self.MIN_SIZE), max_len - len(cells))
+        left = margin // 2
+        self.buf = bytearray(left) + bytearray(cells) + bytearray(margin - left)
+        self.origin = left
+        # Lowest and highest position the head reached, input cells included
+        self.low = 0
+        self.high = max(len(cells) - 1, 0)
+
+    def grow(self, index: int) -> int:
+        """
+        Resize the buffer so buffer ``index`` is in range; returns the shifted index.
+
+        The buffer at least doubles towards the side that overflowed, capped at
+        ``max_len`` cells overall.
+        """
+        size = len(self.buf)
+        if index < 0:
+            needed = size - index
+        else:
+            needed = index + 1
+        if needed > self.max_len:
+            raise TuringConfig.TapeLimitError(
+                f"Tape exceeded MAX_TAPE_LEN of {self.max_len} cells"
+            )
+
+        extra = min(max(needed, 2 * size), self.max_len) - size
+        if index < 0:
+            self.buf[:0] = bytearray(extra)
+            self.origin += extra
+            return index + extra
+
+        self.buf.extend(bytearray(extra))
+        return index
+
+    def read(self, position: int) -> int:
+        index = position + self.origin
+        if 0 <= index < len(self.buf):
+            return self.buf[index]
+        return 0
+
+    def write(self, position: int, symbol_id: int) -> None:
+        index = position + self.origin
+        if not 0 <= index < len(self.buf):
+            index = self.grow(index)
+        self.buf[index] = symbol_id
+
+    def render(self, symbols: list[str]) -> str:
+        """Decode the used region, with surrounding blanks stripped."""
+        used = self.buf.strip(b"\x00")
+        if all(ord(symbol) < 256 for symbol in symbols):
+            table = bytes(ord(symbol) for symbol in symbols) + bytes(256 - len(symbols))
+            return used.translate(table).decode("latin-1")
+        return "".join([symbols[symbol_id] for symbol_id in used])
+
+    def usage(self) -> tuple[int, int]:
+        """Cells spanned by the input and the head, as ``MachineLogic.tape_usage``, and bytes of the buffer."""
+        return self.high - self.low + 1, sys.getsizeof(self.buf)
+
+    def __len__(self) -> int:
+        return len(self.buf)
+
+
+class SparseTape:
+    """Dictionary tape keeping only non-blank cells."""
+
+    def __init__(self, cells: list[int]) -> None:
+        self.cells: dict[int, int] = {
+            idx: symbol_id for idx, symbol_id in enumerate(cells) if symbol_id
+        }
+        # Lowest and highest position the head reached, input cells included
+        self.low = 0
+        self.high = max(len(cells) - 1, 0)
+
+    def read(self, position: int) -> int:
+        return self.cells.get(position, 0)
+
+    def write(self, position: int, symbol_id: int) -> None:
+        if symbol_id:
+            self.cells[position] = symbol_id
+        else:
+            self.cells.pop(position, None)
+
+    def render(self, symbols: list[str]) -> str:
+        """Join the cells between the outermost non-blank positions."""
+        cells = self.cells
+        if not cells:
+            return ""
+        return "".join(
+            [symbols[cells.get(i, 0)] for i in range(min(cells), max(cells) + 1)]
+        )
+
+    def usage(self) -> tuple[int, int]:
+        """Cells spanned by the input and the head, as ``MachineLogic.tape_usage``, and bytes of the cell dict."""
+        return self.high - self.low + 1, sys.getsizeof(self.cells)
+
+    def __len__(self) -> int:
+        return len(self.cells)
@@ -0,0 +1,124 @@
+"""
+Streaming step traces.
+
+``MachineLogic.iter_steps`` yields a ``StepEvent`` per step. ``write_jsonl_trace``
+streams those events to disk in the JSON Lines layout that the web GUI's
+``StateManager.js`` reads and writes. The first line is the metadata object
+(config constants, ``rulesText``, the machine configuration at step 0, ...),
+followed by one history entry per configuration::
+
+    {"tape":{"0":"1","1":"1"},"head":0,"state":"INIT","tape_len":2,"move":"R"}
+
+As in the GUI, the ``move`` of an entry is the move made from that
+configuration, and the last entry has ``"N"``. Entries are written as the
+run goes, through a large buffer, so memory stays constant whatever the
+length of the trace.
+"""
+
+import json
+import os
+from bisect import bisect_left
+from typing import NamedTuple
+
+from TuringMachine import MachineLogic, TuringConfig
+
+_BUFFER_SIZE = 1 << 20
+_encode = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+
+
+class StepEvent(NamedTuple):
+    """One step: ``state``/``head``/``read`` before it, then what it wrote, the move and the state after."""
+
+    step: int
+    state: str
+    head: int
+    read: str
+    write: str
+    move: str
+    next_state: str
+
+
+def trace_metadata(cpu: MachineLogic, rules_text: str, name: str = "") -> dict:
+    """The metadata line of a trace: StateManager.saveState() without ``history``, at the current configuration."""
+    tape = {str(position): symbol for position, symbol in sorted(cpu.tape.items())}
+    return {
+        "name": name,
+        "rulesText": rules_text,
+        "initial_tape": cpu.input_tape,
+        "rulesNo": cpu.rules_no,
+        "max_len": len(tape),
+        "tape_len": len(tape),
+        "step_count": 0,
+        "LEFT": TuringConfig.LEFT,
+        "RIGHT": TuringConfig.RIGHT,
+        "BLANK": cpu.blank_symbol,
+        "INIT_STATE": cpu.init_state,
+        "HALT_STATE": cpu.halt_state,
+        "COMMENT_PREFIX": TuringConfig.COMMENT_PREFIX,
+        "MAX_STATES": TuringConfig.MAX_STATES,
+        "MAX_TAPE_LEN": TuringConfig.MAX_TAPE_LEN,
+        "MAX_STATE_SIZE": TuringConfig.MAX_STATE_SIZE,
+        "TRANSITION_SIZE": TuringConfig.TRANSITION_SIZE,
+        "head_position": cpu.head_position,
+        "current_state": cpu.current_state,
+        "input_tape": cpu.input_tape,
+        "running": cpu.current_state != cpu.halt_state,
+        "tape": tape,
+    }
+
+
+def _encode_cell(position: int, symbol: str) -> str:
+    return f'"{position}":{_encode(symbol)}'
+
+
+def write_jsonl_trace(
+    cpu: MachineLogic,
+    path: str | os.PathLike,
+    input_tape: str,
+    *,
+    rules_text: str,
+    MAX_STEPS: int = 1_000_000,
+    name: str = "",
+) -> int:
+    """
+    Run ``cpu`` on ``input_tape`` and stream its trace to ``path``; returns the step count.
+
+    A stuck machine still gets a complete file up to where it stopped before
+    the MissingTransitionError propagates.
+    """
+    cpu.input_tape = input_tape
+    cpu._set_tape(input_tape)
+    step_count = 0
+    with open(path, "w", encoding="utf-8", buffering=_BUFFER_SIZE) as trace_file:
+        write = trace_file.write
+        write(_encode(trace_metadata(cpu, rules_text, name)))
+        write("\n")
+        # An entry is written once the move out of it is known. The tape is
+        # kept as encoded cells in position order, so a write updates one
+        # cell and only the join is redone
+        blank = cpu.blank_symbol
+        positions = sorted(cpu.tape)
+        cells = [_encode_cell(position, cpu.tape[position]) for position in positions]
+        tape_json = "{" + ",".join(cells) + "}"
+        tape_len = len(cells)
+        head, state = cpu.head_position, cpu.current_state
+        try:
+            for event in cpu.iter_steps(MAX_STEPS=MAX_STEPS):
+                write(f'{{"tape":{tape_json},"head":{head},"state":{_encode(state)},"tape_len":{tape_len},"move":"{event.move}"}}\n')
+                if event.write != event.read:
+                    i = bisect_left(positions, event.head)
+                    present = i < len(positions) and positions[i] == event.head
+                    if event.write == blank:
+                        del positions[i], cells[i]
+                    elif present:
+                        cells[i] = _encode_cell(event.head, event.write)
+                    else:
+                        positions.insert(i, event.head)
+                        cells.insert(i, _encode_cell(event.head, event.write))
+                    tape_json = "{" + ",".join(cells) + "}"
+                    tape_len = len(cells)
+                head, state = cpu.head_position, event.next_state
+                step_count = event.step
+        finally:
+            write(f'{{"tape":{tape_json},"head":{head},"state":{_encode(state)},"tape_len":{tape_len},"move":"N"}}\n')
+    return step_count
@@ -6,6 +6,9 @@ This module provides a simple implementation of a Turing machine.
 LICENSE: MIT
 """
 
+import re
+from typing import NamedTuple
+
 RIGHT = "R"
 LEFT = "L"
 BLANK = "_"
@@ -14,42 +17,115 @@ COMMENT_PREFIX = "//"
 
 TransitionType = tuple[str, str, str, str, str]
 
+_TOKEN = re.compile(r"\S+")
+
+
+class RuleError(NamedTuple):
+    """One invalid line of rule text; ``line`` and ``column`` are 1-based."""
+
+    exception_type: type[Exception]
+    message: str
+    line: int
+    column: int
+
+    def __str__(self) -> str:
+        return f"line {self.line}, col {self.column}: {self.message}"
+
+
+def _column(line: str, token_index: int) -> int:
+    """1-based column of the ``token_index``-th token on ``line`` (only computed for errors)."""
+    for i, match in enumerate(_TOKEN.finditer(line)):
+        if i == token_index:
+            return match.start() + 1
+    return 1
+
 
 def parse_transition_rules(transition_rules_str: str) -> list[TransitionType]:
     """
     Parse a string into a list of transition rules.
 
+    The text is read once, line by line; each line is tokenized and checked
+    as it is read, and parsing goes on past invalid lines so that every error
+    is reported at once.
+
     Args:
         transition_rules_str: A string containing transition rules, with each rule on a new line.
-            Each rule should be space-separated values in the format:
+            Each rule should be whitespace-separated values in the format:
             currentState currentSymbol newState newSymbol moveDirection
 
     Returns:
         A list of transition tuples, where each tuple contains:
         (currentState, currentSymbol, newState, newSymbol, moveDirection)
 
+    Raises:
+        InvalidTransitionError / InvalidSymbolError: of the first invalid line, listing every
+        invalid line with its line and column (the exception's ``errors`` attribute holds them all).
+
     """
     transitions_list: list[TransitionType] = []
-    for raw_line in transition_rules_str.split("\n"):
-        line = raw_line.strip()
-        if not line:
+    defined_on: dict[tuple[str, str], int] = {}
+    errors: list[RuleError] = []
+
+    text = transition_rules_str
+    pos = 0
+    line_no = 0
+    length = len(text)
+    while pos <= length:
+        end = text.find("\n", pos)
+        if end < 0:
+            end = length
+        line = text[pos:end]
+        pos = end + 1
+        line_no += 1
+
+        # Skip comments, whole-line or after the transition rule
+        cut = line.find(COMMENT_PREFIX)
+        if cut >= 0:
+            line = line[:cut]
+        values = line.split()
+        if not values:
             continue
 
-        # Skip whole-line comment
-        if line.startswith(COMMENT_PREFIX):
+        if len(values) != 5:  # noqa: PLR2004
+            msg = (
+                f"Invalid transition: {tuple(values)}. "
+                "Must be in the format (currentState, currentSymbol, newState, newSymbol, moveDirection)"
+            )
+            errors.append(RuleError(InvalidTransitionError, msg, line_no, _column(line, 5 if len(values) > 5 else 0)))  # noqa: PLR2004
             continue
 
-        # Skip comment after the transition rule
-        line = line.split(COMMENT_PREFIX, 1)[0].strip()
+        current_state, current_symbol, new_state, new_symbol, move_direction = values
+        line_errors = len(errors)
+        if move_direction not in [LEFT, RIGHT]:
+            msg = f"Invalid moveDirection: {move_direction}. Must be L or R"
+            errors.append(RuleError(InvalidTransitionError, msg, line_no, _column(line, 4)))
+        for symbol, label, index in ((current_symbol, "current", 1), (new_symbol, "new", 3)):
+            if len(symbol) != 1:
+                msg = f"Invalid {label} symbol {symbol}. Must be a single character."
+                errors.append(RuleError(InvalidSymbolError, msg, line_no, _column(line, index)))
+        if len(errors) > line_errors:
+            continue
 
-        values: list[str] = []
-        for raw_val in line.split(" "):
-            val = raw_val.strip()
-            if not val:
-                continue
-            values.append(val)
+        first_line = defined_on.setdefault((current_state, current_symbol), line_no)
+        if first_line != line_no:
+            msg = (
+                f"Duplicate transition for state {current_state} and symbol {current_symbol} "
+                f"(first defined on line {first_line})"
+            )
+            errors.append(RuleError(InvalidTransitionError, msg, line_no, _column(line, 0)))
+            continue
 
-        transitions_list.append(tuple(values))
+        transitions_list.append((current_state, current_symbol, new_state, new_symbol, move_direction))
+
+    if errors:
+        first = errors[0]
+        if len(errors) == 1:
+            msg = str(first)
+        else:
+            msg = f"{len(errors)} errors in transition rules:\n" + "\n".join(map(str, errors))
+        error = first.exception_type(msg)
+        error.errors = errors
+        raise error
     return transitions_list
 
 
@@ -218,14 +294,22 @@ class LogicMill:
         max_steps: int = 1_000_000,
         *,
         verbose: bool = False,
+        profile=None,
     ) -> tuple[str, int]:
         """
         Run the Logic Mill with the given input string.
 
+        Pass a ``TuringProfile.MachineProfile`` as ``profile`` to count transition
+        hits, direction reversals, tape growth and time per state while running
+        (not combinable with ``verbose``).
+
         Returns a tuple containing the final tape content and the number of steps taken.
         """
         self._set_tape(input_tape)
 
+        if profile is not None:
+            return self._run_profiled(input_tape, max_steps, profile)
+
         if verbose:
             self._print_tape()
 
@@ -276,6 +360,31 @@ class LogicMill:
         msg = f"Max steps reached: {max_steps}"
         raise RuntimeError(msg)
 
+    def _run_profiled(self, input_tape: str, max_steps: int, profile) -> tuple[str, int]:
+        low = min(self.tape, default=0)
+        high = max(self.tape, default=0)
+        self.current_state, self.head_position, _, _, steps_count, stuck = profile.run(
+            self.transitions, self.tape, self.blank_symbol, self.halt_state,
+            self.current_state, self.head_position, low, high, max_steps,
+        )
+
+        if self.current_state == self.halt_state and steps_count < max_steps:
+            return (self._render_tape(), steps_count)
+
+        if stuck:
+            current_symbol = self.tape.get(self.head_position, self.blank_symbol)
+            if not self.transitions.get(self.current_state):
+                msg = f"No transitions for state {self.current_state} with input tape {input_tape}"
+            else:
+                msg = (
+                    f"No transition for symbol {current_symbol or self.blank_symbol} "
+                    f"in state {self.current_state} with input tape {input_tape}"
+                )
+            raise MissingTransitionError(msg)
+
+        msg = f"Max steps reached: {max_steps}"
+        raise RuntimeError(msg)
+
 
 if __name__ == "__main__":
     transition_rules = parse_transition_rules(
@@ -0,0 +1,53 @@
+"""Translated-cycler detection: reported period, shift and start, and no false positives."""
+
+import pytest
+
+from TuringMachine import MachineLogic, TuringConfig, TuringMachine
+
+
+def detect(rules: str, input_tape: str = "", MAX_STEPS: int = 20_000):
+    cpu = MachineLogic(TuringMachine(rules).transition_rules)
+    return cpu.run_logic(input_tape, MAX_STEPS=MAX_STEPS, detect_translations=True)
+
+
+def drifting_rules(move: str) -> str:
+    """Ten states that write a 1 and move on, never looking back."""
+    states = ["INIT"] + [f"Q{i}" for i in range(1, 10)]
+    rules = [f"{state} _ {states[(i + 1) % 10]} 1 {move}" for i, state in enumerate(states)]
+    return "\n".join(rules + ["INIT 1 HALT 1 R"])
+
+
+@pytest.mark.parametrize("move, shift", [("R", 10), ("L", -10)])
+def test_drifting_cycler_is_reported_from_its_first_record(move, shift):
+    with pytest.raises(TuringConfig.NonHaltingError) as caught:
+        detect(drifting_rules(move))
+    assert (caught.value.cycle_length, caught.value.shift, caught.value.cycle_start) == (10, shift, 1)
+
+
+@pytest.mark.parametrize("forward, back, shift", [("R", "L", 2), ("L", "R", -2)])
+def test_cycler_stepping_back_one_cell(forward, back, shift):
+    rules = "\n".join([
+        f"INIT _ A 1 {forward}",
+        f"A _ B _ {back}",
+        f"B 1 C 1 {forward}",
+        f"C _ INIT _ {forward}",
+        "INIT * HALT * R",
+    ])
+    with pytest.raises(TuringConfig.NonHaltingError) as caught:
+        detect(rules)
+    assert (caught.value.cycle_length, caught.value.shift, caught.value.cycle_start) == (4, shift, 1)
+
+
+def test_binary_counter_is_not_reported():
+    rules = "\n".join([
+        "INIT _ INC _ L",
+        "INC 1 INC 0 L",
+        "INC 0 RET 1 R",
+        "INC _ RET 1 R",
+        "RET 0 RET 0 R",
+        "RET 1 RET 1 R",
+        "RET _ INC _ L",
+        "INIT * HALT * R",
+    ])
+    _, steps, _ = detect(rules)
+    assert steps == 20_000